@@ -3,6 +3,13 @@ import os
 
 # Gunicorn Configuration for VOXIS Production Backbone
 
+# CPU threading for torch/MKL/OpenBLAS: cores split between concurrently
+# running pipelines. Must be set before torch/numpy are first imported;
+# explicit environment values win.
+_cpu_threads = str(max(1, (os.cpu_count() or 8) // max(1, int(os.environ.get('VOXIS_MAX_CONCURRENT', 1)))))
+for _var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_var, _cpu_threads)
+
 # Binding
 bind = "0.0.0.0:5001"
 
@@ -10,8 +17,11 @@ bind = "0.0.0.0:5001"
 # 'gthread' is best for I/O bound tasks like file uploads/downloads
 # allowing the worker to handle multiple requests concurrently
 worker_class = "gthread"
-workers = 2  # Sufficient for most CPU-bound pipeline tasks alongside threads
-threads = 4  # Allow 4 concurrent requests per worker
+# Job state lives in-process, so there must be exactly one worker;
+# HTTP concurrency comes from threads (pipelines run on their own pool)
+workers = 1
+# Exported so the app sizes its SSE stream cap from the real thread count
+threads = int(os.environ.setdefault('VOXIS_HTTP_THREADS', '8'))
 
 # Timeouts
 # Processing large audio files takes time. We set a generous timeout.
@@ -26,8 +36,7 @@ errorlog = "-"   # Stderr
 capture_output = True
 
 # Robustness
-max_requests = 1000        # Restart workers after 1000 requests to prevent leaks
-max_requests_jitter = 50   # Add randomness to restarts to avoid all restarting at once
+# No max_requests recycling — a restart would drop in-flight jobs and job state
 preload_app = True         # Load app before forking (faster startup, memory sharing)
 
 # Environment
@@ -20,8 +20,8 @@ PERFORMANCE OPTIMIZATIONS:
   - Cached torchaudio resamplers (avoid re-creating for same sr pairs)
   - Batch resampling in Stage 7 (resample once, not 4x per channel)
   - In-place operations where safe (no unnecessary array copies)
-  - Reduced gc.collect() calls (only at GPU tensor boundaries)
-  - Direct channel processing for stereo (no ThreadPool overhead)
+  - One gc.collect() per run; empty_cache() only under memory pressure
+  - Thread-parallel noisereduce fallback (C kernels release the GIL)
   - Pipeline instance cached between jobs via worker.py singleton
 
 Output naming convention: original_name-voxis.format
@@ -29,6 +29,8 @@ Output naming convention: original_name-voxis.format
 
 import os
 import sys
+import copy
+import math
 import subprocess
 import gc
 import logging
@@ -42,6 +44,10 @@ except ImportError:
     except ImportError:
         pass  # patch not found — DeepFilterNet may fail
 
+# Let the CUDA caching allocator grow segments instead of fragmenting —
+# must be set before the first CUDA allocation
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 import numpy as np
 import soundfile as sf
 import torch
@@ -53,6 +59,7 @@ from scipy.signal import butter, sosfilt
 from typing import Dict, Any, Callable, Optional
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 # Import VOXIS Engine Core Modules (V4)
 # Handle both dev mode (backend.*) and PyInstaller frozen mode
@@ -69,10 +76,21 @@ except ImportError:
         VoxisError, DeviceMemoryError, ModelLoadError, AudioProcessingError, FormatUnsupportedError
     )
 
-# PERFORMANCE: Set torch to use all available threads and optimize for inference
-torch.set_num_threads(max(1, os.cpu_count() or 4))
+# PERFORMANCE: Split the cores between concurrently running pipelines
+# (VOXIS_MAX_CONCURRENT) so parallel jobs don't oversubscribe the CPU, and
+# keep inter-op parallelism to one pool. Optimize for inference.
+TORCH_THREADS = max(1, (os.cpu_count() or 4) // max(1, int(os.environ.get('VOXIS_MAX_CONCURRENT', 1))))
+torch.set_num_threads(TORCH_THREADS)
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    pass  # Inter-op pool already started (torch used before this import)
 torch.set_grad_enabled(False)  # Global: no gradient computation needed for inference
 
+# Below this fraction of free device memory, a finished run returns cached
+# CUDA blocks to the driver
+CUDA_LOW_MEMORY_FRACTION = 0.1
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -125,6 +143,13 @@ except ImportError:
         SHARDING_AVAILABLE = False
         print("WARNING: VOXIS Sharding (audio-separator) not available. Install with: pip install audio-separator[cpu]")
 
+# Container for the intermediate vocal stem (read straight back by Stage 5).
+# 'flac' roughly halves the stem's disk write+read — worth it when the temp
+# dir is on network/cloud block storage; 'wav' skips the encode on local disk.
+UVR_STEM_FORMAT = os.environ.get("VOXIS_UVR_STEM_FORMAT", "wav").lower()
+if UVR_STEM_FORMAT not in ("wav", "flac"):
+    UVR_STEM_FORMAT = "wav"
+
 # Diff-HierVC (hayeong0/Diff-HierVC)
 try:
     diff_hier_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "voxis_engine", "models", "diff_hiervc")
@@ -165,6 +190,110 @@ except ImportError:
         SPECTRUM_AVAILABLE = False
         print("WARNING: SpectrumAnalyzer wrapper not available.")
 
+# numpy-rms (optional SIMD RMS kernel) — falls back to a NumPy dot product
+try:
+    import numpy_rms
+    NUMPY_RMS_AVAILABLE = True
+except ImportError:
+    NUMPY_RMS_AVAILABLE = False
+
+
+# PERFORMANCE: RAM-backed scratch dir for file-only tools (PhaseLimiter) —
+# tmpfs skips the page-cache writeback of a regular disk tempfile
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def _scratch_dir(needed_bytes: int):
+    """
+    Directory for an intermediate file of about `needed_bytes`: the tmpfs
+    scratch dir when it has 2x headroom, else None (system temp dir).
+    PERFORMANCE: Stage hand-off files (stems, resample/upscale inputs) are
+    written and read straight back — on RAM they never touch block storage.
+    """
+    if _SCRATCH_DIR is None:
+        return None
+    try:
+        free = shutil.disk_usage(_SCRATCH_DIR).free
+    except OSError:
+        return None
+    return _SCRATCH_DIR if free > 2 * needed_bytes else None
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """
+    Duplicate src at dst as cheaply as the filesystem allows:
+    hardlink → in-kernel copy_file_range (reflink on CoW filesystems) → byte copy.
+    """
+    if os.path.exists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    elif sys.platform == "darwin":
+        # APFS clonefile
+        if subprocess.run(["cp", "-c", src, dst], capture_output=True).returncode == 0:
+            return
+    shutil.copy2(src, dst)
+
+
+# ---------------------------------------------------------------------------
+# Signal helpers
+# ---------------------------------------------------------------------------
+
+def _rms(x: np.ndarray) -> float:
+    """RMS over all samples via a single dot product (no x**2 temporary)."""
+    flat = x.reshape(-1)
+    if NUMPY_RMS_AVAILABLE and flat.dtype == np.float32 and flat.flags.c_contiguous:
+        # One window spanning the whole buffer → a single SIMD RMS value
+        return float(numpy_rms.rms(flat, window_size=flat.size)[0])
+    return float(np.sqrt(np.dot(flat, flat) / flat.size))
+
+
+def _dbfs(rms: float) -> float:
+    """Scalar RMS → dBFS with math.log10 (no NumPy scalar dispatch); -200 for silence."""
+    return 20.0 * math.log10(rms) if rms > 1e-20 else -200.0
+
+
+def _peak(x: np.ndarray) -> float:
+    """Absolute peak via max/min reductions (no np.abs temporary)."""
+    return max(float(x.max()), -float(x.min()))
+
+
+def _soft_clip_(x: np.ndarray, ceiling: float) -> np.ndarray:
+    """
+    In-place soft-clip ~ ceiling * tanh(x / ceiling), asymptotic to ±ceiling.
+    Rational tanh approximation u(27 + u²)/(27 + 9u²), clamped at |u| = 3
+    where it meets ±1 with zero slope: within ~0.024·ceiling of tanh, so
+    levels below the ceiling stay where the tanh limiter put them, but no
+    transcendental per sample.
+    """
+    x *= 1.0 / ceiling
+    np.clip(x, -3.0, 3.0, out=x)
+    denom = np.square(x)
+    num = denom + 27.0
+    denom *= 9.0
+    denom += 27.0
+    x *= num
+    np.divide(x, denom, out=x)
+    x *= ceiling
+    return x
+
 
 class VoxisPipeline:
     """
@@ -218,6 +347,10 @@ class VoxisPipeline:
         # PERFORMANCE: Cache torchaudio resamplers — avoids re-creating for same sr pairs
         self._resampler_cache: Dict[tuple, torchaudio.transforms.Resample] = {}
 
+        # Cached instance that per-job views (with_runtime_config) copy from;
+        # process-wide model state such as the compile fallback lives here
+        self._owner = self
+
         # PERFORMANCE: Correct path resolution for PyInstaller frozen mode + Electron Bundle
         if os.environ.get("VOXIS_ROOT_PATH"):
             exe_dir = os.environ["VOXIS_ROOT_PATH"]
@@ -281,6 +414,7 @@ class VoxisPipeline:
 
     # --- Neural Reconstruction (Restore) — Always active ------------------
         self.voicerestore_model = None
+        self._voicerestore_compiled = False
         if VOICERESTORE_AVAILABLE:
             try:
                 checkpoint_dir = os.path.join(self.models_dir, "TrinityRestore")
@@ -306,6 +440,17 @@ class VoxisPipeline:
                     model.load_state_dict(state_dict, strict=False)
                     model.to(self.device).eval()
                     self.voicerestore_model = optimize_model_for_inference(model, device=self.device, enable_fp16=(self.device != "mps"))
+                    # PERFORMANCE: CUDA graphs via reduce-overhead remove per-step
+                    # kernel launch overhead in the ODE loop. Inputs are padded to
+                    # fixed buckets (see _voicerestore_forward) so graphs are reused.
+                    if self.device == "cuda" and hasattr(torch, "compile"):
+                        try:
+                            self.voicerestore_model = torch.compile(
+                                self.voicerestore_model, mode="reduce-overhead", dynamic=False
+                            )
+                            self._voicerestore_compiled = True
+                        except Exception as e:
+                            logger.warning(f"VoiceRestore torch.compile unavailable, running eager: {e}")
                     print("VoiceRestore loaded — voice-optimized restoration mode")
                 else:
                     print(f"VoiceRestore checkpoint not found at {ckpt_path}")
@@ -355,7 +500,7 @@ class VoxisPipeline:
             try:
                 self.uvr_wrapper = UVRWrapper(
                     model_filename="UVR-MDX-NET-Voc_FT.onnx",
-                    output_format="wav",
+                    output_format=UVR_STEM_FORMAT,
                     normalization_threshold=0.9,
                     output_single_stem="vocals",
                     log_level=logging.WARNING
@@ -367,6 +512,26 @@ class VoxisPipeline:
         # PERFORMANCE: Pre-compute filters at default sample rate (48kHz)
         self._precompute_filters(self.target_sample_rate)
 
+    # Config keys that only steer per-run DSP, with their create_pipeline() defaults
+    RUNTIME_CONFIG_DEFAULTS = {
+        "denoise_strength": 0.92, "voicerestore_cfg": 0.5, "hp_freq": 80.0,
+        "lp_freq": 16000.0, "amp_target_db": -16.0, "amp_threshold_db": -26.0,
+    }
+
+    def with_runtime_config(self, config: Dict[str, Any]) -> "VoxisPipeline":
+        """Return a per-job view carrying this job's knobs (no model reload).
+
+        The view is a shallow copy, so it shares the loaded models but never
+        writes to the cached instance — concurrent jobs can't race on knobs.
+        """
+        view = copy.copy(self)
+        for key, default in self.RUNTIME_CONFIG_DEFAULTS.items():
+            setattr(view, key, config.get(key, default))
+        # Filter cutoffs may have moved — recompute coefficients on the view only
+        view._filter_sr = None
+        view._precompute_filters(view.target_sample_rate)
+        return view
+
     # ── PERFORMANCE: Pre-computed filter coefficients ─────────────────────
     def _precompute_filters(self, sr: int):
         """Pre-compute Butterworth SOS coefficients for given sample rate."""
@@ -447,7 +612,7 @@ class VoxisPipeline:
                 details["channels"].append({"channel": i, "action": "silence_skip"})
                 continue
 
-            rms_db = 20 * np.log10(rms + 1e-10)
+            rms_db = _dbfs(rms)
 
             if rms_db < threshold:
                 gain_db = min(target - rms_db, max_gain_db)
@@ -470,7 +635,7 @@ class VoxisPipeline:
                     "action": "boosted",
                     "original_rms_db": round(float(rms_db), 2),
                     "gain_db": round(float(gain_db), 2),
-                    "new_rms_db": round(float(20 * np.log10(new_rms + 1e-10)), 2),
+                    "new_rms_db": round(_dbfs(new_rms), 2),
                 })
             else:
                 details["channels"].append({
@@ -481,7 +646,114 @@ class VoxisPipeline:
 
         return audio, details
 
-    # ── PERFORMANCE: Batch VoiceRestore inference (both channels at once) ─
+    # ── PERFORMANCE: Bounded-memory DeepFilterNet inference ──────────────
+    DF_CHUNK_SEC = 10.0
+    DF_OVERLAP_SEC = 0.5
+
+    def _df_enhance(self, channel: np.ndarray) -> np.ndarray:
+        """Run DeepFilterNet on one mono block and return a float32 array."""
+        channel_tensor = torch.from_numpy(np.ascontiguousarray(channel)).float()
+        if channel_tensor.dim() == 1:
+            channel_tensor = channel_tensor.unsqueeze(0)
+
+        with torch.inference_mode():
+            enhanced_tensor = enhance(
+                self.df_model,
+                self.df_state,
+                channel_tensor,
+                atten_lim_db=40,  # 40dB limit — aggressive but preserves vocals
+            )
+        if isinstance(enhanced_tensor, torch.Tensor):
+            enhanced = enhanced_tensor.squeeze(0).numpy() if enhanced_tensor.dim() > 1 else enhanced_tensor.numpy()
+        else:
+            enhanced = enhanced_tensor.squeeze() if enhanced_tensor.ndim > 1 else enhanced_tensor
+        return enhanced
+
+    def _df_enhance_chunked(self, channel: np.ndarray, sr: int) -> np.ndarray:
+        """
+        Run DeepFilterNet over a mono channel in overlapping chunks.
+        Keeps the model's working set bounded for long files instead of
+        sending one full-length tensor. Seams are joined with a linear
+        crossfade; the overlap also covers the recurrent warm-up that
+        enhance() incurs at the start of every call.
+        """
+        n = channel.shape[-1]
+        chunk = int(self.DF_CHUNK_SEC * sr)
+        overlap = int(self.DF_OVERLAP_SEC * sr)
+        if n <= chunk:
+            return self._df_enhance(channel)
+
+        out = np.empty(n, dtype=np.float32)
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        step = chunk - overlap
+        start = 0
+        while True:
+            end = min(start + chunk, n)
+            seg_len = end - start
+            block = self._df_enhance(channel[start:end])[:seg_len]
+            if block.shape[-1] < seg_len:
+                block = np.pad(block, (0, seg_len - block.shape[-1]))
+
+            if start == 0:
+                out[start:end] = block
+            else:
+                ov = min(overlap, seg_len)
+                ramp = fade_in[:ov]
+                seam = out[start:start + ov]
+                seam -= seam * ramp
+                seam += block[:ov] * ramp
+                out[start + ov:end] = block[ov:]
+
+            if end == n:
+                break
+            start += step
+        return out
+
+    # ── PERFORMANCE: Compiled VoiceRestore inference ─────────────────────
+    VR_BUCKET = 24000  # 1 s at 24 kHz — compiled graphs are keyed per bucket
+
+    def _voicerestore_forward(self, channel_24k: np.ndarray) -> np.ndarray:
+        """
+        Run one VoiceRestore forward pass on a 24kHz mono channel.
+        When compiled, the input is right-padded to a whole bucket so CUDA
+        graphs are captured once per bucket length and replayed afterwards.
+        """
+        # Model and compile state are read through the cached owner, so a
+        # fallback in one job disables compile for every later job too
+        owner = self._owner
+        compiled = owner._voicerestore_compiled
+        n = channel_24k.shape[-1]
+        x = channel_24k
+        if compiled:
+            padded_len = -(-n // self.VR_BUCKET) * self.VR_BUCKET
+            if padded_len != n:
+                x = np.pad(channel_24k, (0, padded_len - n))
+
+        input_tensor = torch.from_numpy(x).float().unsqueeze(0).to(self.device)
+        try:
+            with torch.inference_mode():
+                restored_tensor = owner.voicerestore_model.forward(
+                    input_tensor,
+                    steps=self.voicerestore_steps,
+                    cfg_strength=self.voicerestore_cfg,
+                )
+        except Exception as e:
+            if not compiled:
+                raise
+            # Compilation is lazy — fall back to eager for the rest of the process
+            logger.warning(f"Compiled VoiceRestore failed, reverting to eager: {e}")
+            owner.voicerestore_model = getattr(owner.voicerestore_model, "_orig_mod", owner.voicerestore_model)
+            owner._voicerestore_compiled = False
+            self.voicerestore_model = owner.voicerestore_model
+            self._voicerestore_compiled = False
+            del input_tensor
+            return self._voicerestore_forward(channel_24k)
+
+        restored = restored_tensor.detach().cpu().squeeze(0).numpy()[..., :n]
+        # PERFORMANCE: Free GPU tensors immediately
+        del input_tensor, restored_tensor
+        return restored
+
     def _voicerestore_pass(self, audio_channels_24k: list, pass_name: str) -> list:
         """
         Run VoiceRestore on a list of 24kHz channel arrays.
@@ -490,17 +762,7 @@ class VoxisPipeline:
         results = []
         for channel_24k in audio_channels_24k:
             try:
-                input_tensor = torch.from_numpy(channel_24k).float().unsqueeze(0).to(self.device)
-                with torch.inference_mode():
-                    restored_tensor = self.voicerestore_model.forward(
-                        input_tensor,
-                        steps=self.voicerestore_steps,
-                        cfg_strength=self.voicerestore_cfg,
-                    )
-                restored_np = restored_tensor.detach().cpu().squeeze(0).numpy()
-                results.append(restored_np)
-                # PERFORMANCE: Free GPU tensor immediately
-                del input_tensor, restored_tensor
+                results.append(self._voicerestore_forward(channel_24k))
             except Exception as e:
                 logger.error(f"{pass_name} failed: {e}")
                 results.append(channel_24k)  # fallback: return input unchanged
@@ -570,7 +832,8 @@ class VoxisPipeline:
             if input_ext in SUPPORTED_VIDEO:
                 update_progress("ingest", 15, {"message": "Extracting audio from video"})
                 try:
-                    extracted = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
+                    extracted = tempfile.NamedTemporaryFile(
+                        suffix=".wav", delete=False, dir=_scratch_dir(os.path.getsize(input_path)))
                     extracted_path = extracted.name
                     extracted.close()
                     cmd = [
@@ -581,7 +844,7 @@ class VoxisPipeline:
                     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=300)
                     actual_input = extracted_path
                     load_method = "ffmpeg_video_extract"
-                    print(f"INGEST: Extracted audio from video {input_ext}")
+                    logger.info("INGEST: Extracted audio from video %s", input_ext)
                 except subprocess.CalledProcessError as e:
                     raise AudioProcessingError(f"FFmpeg video extraction failed: {e.stderr.decode()[:200]}", stage="INGEST")
                 except subprocess.TimeoutExpired:
@@ -595,8 +858,10 @@ class VoxisPipeline:
 
             # Strategy 1: soundfile (fastest)
             try:
-                audio, sr = sf.read(actual_input, always_2d=True)
-                audio = audio.T
+                # PERFORMANCE: Decode straight to float32 — the pipeline never
+                # needs float64, and every later reduction moves half the bytes
+                audio, sr = sf.read(actual_input, dtype='float32', always_2d=True)
+                audio = np.ascontiguousarray(audio.T)
                 load_method = load_method if load_method != "unknown" else "soundfile"
             except Exception as sf_err:
                 logger.warning(f"soundfile failed: {sf_err}")
@@ -615,7 +880,9 @@ class VoxisPipeline:
             if audio is None:
                 try:
                     update_progress("ingest", 35, {"message": "Converting via ffmpeg"})
-                    ffmpeg_tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
+                    # Decoded PCM can be ~10x a compressed source
+                    ffmpeg_tmp = tempfile.NamedTemporaryFile(
+                        suffix=".wav", delete=False, dir=_scratch_dir(os.path.getsize(actual_input) * 10))
                     ffmpeg_tmp_path = ffmpeg_tmp.name
                     ffmpeg_tmp.close()
                     cmd = [
@@ -624,8 +891,8 @@ class VoxisPipeline:
                         ffmpeg_tmp_path
                     ]
                     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=300)
-                    audio, sr = sf.read(ffmpeg_tmp_path, always_2d=True)
-                    audio = audio.T
+                    audio, sr = sf.read(ffmpeg_tmp_path, dtype='float32', always_2d=True)
+                    audio = np.ascontiguousarray(audio.T)
                     load_method = "ffmpeg_convert"
                     os.unlink(ffmpeg_tmp_path)
                 except Exception as ff_err:
@@ -651,7 +918,7 @@ class VoxisPipeline:
             # ── NORMALIZE TO FLOAT32 [-1, 1] ──────────────────────────────
             if audio.dtype != np.float32:
                 audio = audio.astype(np.float32)
-            peak = np.max(np.abs(audio))
+            peak = _peak(audio)
             if peak > 1.0:
                 audio /= peak  # In-place
             elif peak < 1e-10:
@@ -659,8 +926,9 @@ class VoxisPipeline:
             elif peak < 0.1:
                 gain = 0.5 / peak
                 audio *= gain  # In-place
-                print(f"INGEST: Quiet input (peak={peak:.6f}), boosted to {np.max(np.abs(audio)):.3f}")
-                peak = np.max(np.abs(audio))
+                new_peak = peak * gain  # Linear gain — no need to re-scan
+                logger.info("INGEST: Quiet input (peak=%.6f), boosted to %.3f", peak, new_peak)
+                peak = new_peak
 
             update_progress("ingest", 80, {"message": "Gathering metadata"})
 
@@ -680,7 +948,8 @@ class VoxisPipeline:
             }
             results["original_name"] = original_basename
 
-            print(f"INGEST: .{input_ext} | {original_sr}Hz | {original_channels}ch | {original_duration:.1f}s | {file_size/1024:.0f}KB | via {load_method}")
+            logger.info("INGEST: .%s | %dHz | %dch | %.1fs | %.0fKB | via %s",
+                        input_ext, original_sr, original_channels, original_duration, file_size / 1024, load_method)
             update_progress("ingest", 100)
 
             # ==============================================================
@@ -714,7 +983,7 @@ class VoxisPipeline:
                     "low_pass_hz": self.lp_freq,
                     "voice_optimized": True,
                 }
-                print(f"FILTER: Voice-band HP={self.hp_freq}Hz LP={self.lp_freq}Hz applied")
+                logger.info("FILTER: Voice-band HP=%sHz LP=%sHz applied", self.hp_freq, self.lp_freq)
             except Exception as e:
                 logger.error(f"Frequency filter failed: {e}. Continuing without filtering.")
                 results["stages"]["filter"] = {"error": str(e)}
@@ -737,31 +1006,22 @@ class VoxisPipeline:
 
                 num_channels = resampled_audio.shape[0]
 
-                # PERFORMANCE: Direct processing for stereo (no ThreadPool overhead)
                 def _denoise_channel(channel):
                     """Denoise a single channel with gain preservation."""
-                    channel_tensor = torch.from_numpy(channel).float()
-                    if channel_tensor.dim() == 1:
-                        channel_tensor = channel_tensor.unsqueeze(0)
-
-                    with torch.inference_mode():
-                        enhanced_tensor = enhance(
-                            self.df_model,
-                            self.df_state,
-                            channel_tensor,
-                            atten_lim_db=40,  # 40dB limit — aggressive but preserves vocals
-                        )
-                    if isinstance(enhanced_tensor, torch.Tensor):
-                        enhanced = enhanced_tensor.squeeze(0).numpy() if enhanced_tensor.dim() > 1 else enhanced_tensor.numpy()
-                    else:
-                        enhanced = enhanced_tensor.squeeze() if enhanced_tensor.ndim > 1 else enhanced_tensor
+                    enhanced = self._df_enhance_chunked(channel, df_sr)
 
-                    # Blend with strength
-                    blended = self.denoise_strength * enhanced + (1 - self.denoise_strength) * channel
+                    # Blend with strength — PERFORMANCE: scale the model output in
+                    # place and accumulate into a single output buffer instead of
+                    # allocating s*enhanced, (1-s)*channel and their sum
+                    if enhanced.dtype != np.float32 or not enhanced.flags.writeable:
+                        enhanced = enhanced.astype(np.float32)
+                    enhanced *= self.denoise_strength
+                    blended = np.multiply(channel, 1 - self.denoise_strength, dtype=np.float32)
+                    blended += enhanced
 
                     # Gain preservation — restore original RMS after denoise blend
-                    orig_rms = np.sqrt(np.dot(channel, channel) / len(channel))
-                    blend_rms = np.sqrt(np.dot(blended, blended) / len(blended))
+                    orig_rms = _rms(channel)
+                    blend_rms = _rms(blended)
                     if blend_rms > 1e-10 and orig_rms > 1e-10:
                         gain_restore = min(orig_rms / blend_rms, 2.0)
                         blended *= gain_restore
@@ -769,8 +1029,9 @@ class VoxisPipeline:
                     return blended
 
                 try:
-                    # PERFORMANCE: Process channels directly — ThreadPool overhead
-                    # isn't worth it for just 1-2 channels
+                    # Channels stay serial here: the DeepFilterNet model (GRU hidden
+                    # state) and df_state (STFT analysis memory) are mutated per
+                    # call and cannot be shared between threads
                     denoised_channels = np.empty_like(resampled_audio)
                     for i in range(num_channels):
                         denoised_channels[i] = _denoise_channel(resampled_audio[i])
@@ -795,14 +1056,21 @@ class VoxisPipeline:
             else:
                 # Fallback — noisereduce spectral gating (voice-tuned)
                 try:
-                    denoised_channels = np.empty_like(audio)
-                    for i in range(audio.shape[0]):
-                        denoised_channels[i] = nr.reduce_noise(
-                            y=audio[i], sr=sr, stationary=False,
+                    def _reduce_channel(channel):
+                        return nr.reduce_noise(
+                            y=channel, sr=sr, stationary=False,
                             prop_decrease=self.denoise_strength,
                             n_fft=2048, hop_length=512,
                         )
-                        update_progress("denoise", int((i + 1) / audio.shape[0] * 100))
+
+                    # PERFORMANCE: noisereduce is stateless and spends its time in
+                    # GIL-releasing FFT kernels — run channels concurrently
+                    num_channels = audio.shape[0]
+                    denoised_channels = np.empty_like(audio)
+                    with ThreadPoolExecutor(max_workers=num_channels) as ex:
+                        for i, reduced in enumerate(ex.map(_reduce_channel, audio)):
+                            denoised_channels[i] = reduced
+                            update_progress("denoise", int((i + 1) / num_channels * 100))
                     denoised_audio = denoised_channels
                     current_sr = sr
                     results["stages"]["denoise"] = {
@@ -830,110 +1098,78 @@ class VoxisPipeline:
 
             if SHARDING_AVAILABLE:
                 dense_input = None
-                dense_output_dir = None
-                pre_sharding_rms = np.sqrt(np.mean(denoised_audio ** 2))
+                pre_sharding_rms = _rms(denoised_audio)  # audio is host-resident here
                 try:
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                        dense_input = tmp.name
-                        sf.write(dense_input, denoised_audio.T, current_sr)
+                    # Input + vocal stem, each at most the float32 buffer size
+                    dense_dir = _scratch_dir(2 * denoised_audio.nbytes)
+                    with tempfile.TemporaryDirectory(prefix="voxis_dense_", dir=dense_dir) as dense_output_dir:
+                        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=dense_dir) as tmp:
+                            dense_input = tmp.name
+                            sf.write(dense_input, denoised_audio.T, current_sr)
 
-                    dense_output_dir = tempfile.mkdtemp(prefix="voxis_dense_")
-                    update_progress("sharding", 20, {"message": "Running vocal isolation"})
+                        update_progress("sharding", 20, {"message": "Running vocal isolation"})
 
-                    if self.uvr_wrapper:
-                        separation_files = self.uvr_wrapper.separate(dense_input, dense_output_dir)
-                    else:
-                         raise RuntimeError("VOXIS Sharding engine not initialized")
-
-                    update_progress("sharding", 80, {"message": "Loading isolated vocals"})
-
-                    # ── VOCAL STEM SELECTION ──────────────────────────────────
-                    # output_single_stem="vocals" is set, so separator should return
-                    # only the vocal stem file. Log everything for diagnostics.
-                    vocal_loaded = False
-                    print(f"SHARDING: Separator returned {len(separation_files) if separation_files else 0} files: {separation_files}")
-
-                    if separation_files:
-                        # Strategy 1: If output_single_stem is configured, there should be
-                        # exactly one file — use it directly (it IS the vocal stem)
-                        if len(separation_files) == 1:
+                        if self.uvr_wrapper:
+                            separation_files = self.uvr_wrapper.separate(dense_input, dense_output_dir)
+                        else:
+                             raise RuntimeError("VOXIS Sharding engine not initialized")
+
+                        update_progress("sharding", 80, {"message": "Loading isolated vocals"})
+
+                        # ── VOCAL STEM SELECTION ──────────────────────────────────
+                        # output_single_stem="vocals" is configured, so the separator
+                        # returns exactly one (resolved) file and it IS the vocal stem.
+                        # Anything else is a misconfiguration, not something to guess at.
+                        vocal_loaded = False
+                        logger.debug("SHARDING: Separator returned %d files: %s",
+                                     len(separation_files) if separation_files else 0, separation_files)
+
+                        if separation_files:
+                            if len(separation_files) != 1:
+                                raise AudioProcessingError(
+                                    f"UVR must be configured with output_single_stem='vocals' "
+                                    f"(got {len(separation_files)} stems)",
+                                    stage="SHARDING"
+                                )
                             stem_path = separation_files[0]
-                            if os.path.exists(stem_path):
-                                dense_audio, dense_sr = sf.read(stem_path, always_2d=True)
-                                dense_audio = dense_audio.T
-                                vocal_loaded = True
-                                print(f"SHARDING: Single-stem mode — using {os.path.basename(stem_path)}")
-
-                        # Strategy 2: Multiple files — search for vocal stem by name patterns
-                        if not vocal_loaded:
-                            vocal_patterns = ["(Vocals)", "Vocals", "vocal", "voice"]
-                            instrumental_patterns = ["(Instrumental)", "Instrumental", "instrumental", "inst", "accompaniment"]
-                            
-                            for fpath in separation_files:
-                                basename = os.path.basename(fpath)
-                                # Check if this is a VOCAL file (not instrumental)
-                                is_vocal = any(p in basename for p in vocal_patterns)
-                                is_instrumental = any(p in basename for p in instrumental_patterns)
-                                
-                                if is_vocal and not is_instrumental and os.path.exists(fpath):
-                                    dense_audio, dense_sr = sf.read(fpath, always_2d=True)
-                                    dense_audio = dense_audio.T
-                                    vocal_loaded = True
-                                    print(f"SHARDING: Found vocal stem: {basename}")
-                                    break
-
-                        # Strategy 3: Last resort — use the SMALLEST file (vocals are
-                        # typically smaller than the full mix/instrumental)
-                        if not vocal_loaded:
-                            existing_files = [(f, os.path.getsize(f)) for f in separation_files if os.path.exists(f)]
-                            if existing_files:
-                                # Skip any file with instrumental patterns
-                                non_instrumental = [
-                                    (f, s) for f, s in existing_files
-                                    if not any(p in os.path.basename(f) for p in ["Instrumental", "instrumental", "accompaniment"])
-                                ]
-                                if non_instrumental:
-                                    # Use the one that's NOT instrumental
-                                    chosen = non_instrumental[0][0]
-                                else:
-                                    # All files look instrumental — just use the first
-                                    chosen = existing_files[0][0]
-                                
-                                dense_audio, dense_sr = sf.read(chosen, always_2d=True)
-                                dense_audio = dense_audio.T
-                                vocal_loaded = True
-                                print(f"SHARDING: WARNING — Fallback stem selection used: {os.path.basename(chosen)}")
-                                print(f"SHARDING: Available files were: {[os.path.basename(f) for f, _ in existing_files]}")
-
-                    if vocal_loaded:
-                        if dense_sr != current_sr:
-                            dense_audio = self._resample(dense_audio, dense_sr, current_sr)
-
-                        # SAFETY CHECK: If sharding removed >90% of energy, skip it
-                        # (means vocals were likely misclassified as instrumental)
-                        post_sharding_rms = np.sqrt(np.mean(dense_audio ** 2))
-                        rms_ratio = post_sharding_rms / (pre_sharding_rms + 1e-10)
-                        print(f"SHARDING: RMS ratio = {rms_ratio:.3f} (pre={pre_sharding_rms:.4f}, post={post_sharding_rms:.4f})")
-
-                        if rms_ratio < 0.1:
-                            print(f"SHARDING: WARNING — Vocal stem lost >90% energy (ratio={rms_ratio:.3f}). Skipping separation.")
-                            results["stages"]["sharding"] = {
-                                "method": "skipped_safety",
-                                "reason": f"Vocal stem energy too low (ratio={rms_ratio:.3f})",
-                            }
+                            # PERFORMANCE: Decode straight to float32 (no float64 buffer +
+                            # astype) and make the channel-major layout contiguous once
+                            dense_audio, dense_sr = sf.read(stem_path, dtype='float32', always_2d=True)
+                            dense_audio = np.ascontiguousarray(dense_audio.T)
+                            vocal_loaded = True
+                            logger.info("SHARDING: Single-stem mode — using %s", os.path.basename(stem_path))
+
+                        if vocal_loaded:
+                            if dense_sr != current_sr:
+                                dense_audio = self._resample(dense_audio, dense_sr, current_sr)
+
+                            # SAFETY CHECK: If sharding removed >90% of energy, skip it
+                            # (means vocals were likely misclassified as instrumental)
+                            post_sharding_rms = _rms(dense_audio)
+                            rms_ratio = post_sharding_rms / (pre_sharding_rms + 1e-10)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("SHARDING: RMS ratio = %.3f (pre=%.4f, post=%.4f)",
+                                             rms_ratio, pre_sharding_rms, post_sharding_rms)
+
+                            if rms_ratio < 0.1:
+                                logger.warning("SHARDING: Vocal stem lost >90%% energy (ratio=%.3f). Skipping separation.", rms_ratio)
+                                results["stages"]["sharding"] = {
+                                    "method": "skipped_safety",
+                                    "reason": f"Vocal stem energy too low (ratio={rms_ratio:.3f})",
+                                }
+                            else:
+                                denoised_audio = dense_audio
+                                logger.info("SHARDING: Vocal isolation complete — %s", denoised_audio.shape)
+                                results["stages"]["sharding"] = {
+                                    "method": "VOXIS Sharding",
+                                    "engine": "MDX-NET",
+                                    "model": "UVR-MDX-NET-Voc_FT",
+                                    "stem": "vocals",
+                                    "rms_ratio": round(float(rms_ratio), 3),
+                                }
                         else:
-                            denoised_audio = dense_audio
-                            print(f"SHARDING: Vocal isolation complete — {denoised_audio.shape}")
-                            results["stages"]["sharding"] = {
-                                "method": "VOXIS Sharding",
-                                "engine": "MDX-NET",
-                                "model": "UVR-MDX-NET-Voc_FT",
-                                "stem": "vocals",
-                                "rms_ratio": round(float(rms_ratio), 3),
-                            }
-                    else:
-                        print("SHARDING: No output files found — skipping separation")
-                        results["stages"]["sharding"] = {"method": "skipped", "note": "No output files found"}
+                            logger.warning("SHARDING: No output files found — skipping separation")
+                            results["stages"]["sharding"] = {"method": "skipped", "note": "No output files found"}
 
                 except Exception as e:
                     logger.error(f"VOXIS Sharding failed: {e}. Continuing without separation.")
@@ -941,22 +1177,13 @@ class VoxisPipeline:
                     traceback.print_exc()
                     results["stages"]["sharding"] = {"method": "skipped", "error": str(e)}
                 finally:
-                    # Clean up temp files including any stray separator outputs
-                    try:
-                        if dense_input and os.path.exists(dense_input):
+                    # Stems live in dense_output_dir (removed by TemporaryDirectory);
+                    # only the separator input needs explicit cleanup here
+                    if dense_input and os.path.exists(dense_input):
+                        try:
                             os.unlink(dense_input)
-                        if dense_output_dir and os.path.exists(dense_output_dir):
-                            shutil.rmtree(dense_output_dir, ignore_errors=True)
-                        # Clean any stray separator output in CWD
-                        cwd = os.getcwd()
-                        for f in os.listdir(cwd):
-                            if f.startswith("tmp") and f.endswith(".wav") and ("Vocals" in f or "Instrumental" in f):
-                                try:
-                                    os.unlink(os.path.join(cwd, f))
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
+                        except OSError:
+                            pass
             else:
                 results["stages"]["sharding"] = {"method": "skipped", "note": "VOXIS Sharding not installed"}
 
@@ -975,7 +1202,7 @@ class VoxisPipeline:
                     "threshold_db": self.amp_threshold_db,
                     "details": amp_details,
                 }
-                print(f"AMPLIFY: Voice amplification applied — {amp_details}")
+                logger.debug("AMPLIFY: Voice amplification applied — %s", amp_details)
             except Exception as e:
                 logger.error(f"Dynamic amplification failed: {e}. Continuing.")
                 results["stages"]["amplify"] = {"error": str(e)}
@@ -993,8 +1220,10 @@ class VoxisPipeline:
 
             hybrid_methods = []
             if self.diff_hier_model is not None or self.voicerestore_model is not None:
-                num_ch = denoised_audio.shape[0]
-                processed_channels = []
+                num_ch, num_samples = denoised_audio.shape
+                # PERFORMANCE: Pre-allocate the output — avoids the list-append +
+                # np.array() stack copy (2x peak memory) at the end of the stage
+                processed_channels = np.empty((num_ch, num_samples), dtype=np.float32)
 
                 for i in range(num_ch):
                     update_progress("hybrid_restore", int((i / num_ch) * 90), {"channel": i+1})
@@ -1010,15 +1239,7 @@ class VoxisPipeline:
                     # 1. Transformer Pre-Pass (VoiceRestore)
                     if self.voicerestore_model is not None:
                         try:
-                            input_tensor = torch.from_numpy(channel_24k).float().unsqueeze(0).to(self.device)
-                            with torch.inference_mode():
-                                restored_tensor = self.voicerestore_model.forward(
-                                    input_tensor,
-                                    steps=self.voicerestore_steps,
-                                    cfg_strength=self.voicerestore_cfg,
-                                )
-                            channel_24k = restored_tensor.detach().cpu().squeeze(0).numpy()
-                            del input_tensor, restored_tensor
+                            channel_24k = self._voicerestore_forward(channel_24k)
                             if "VoiceRestore(Pre)" not in hybrid_methods:
                                 hybrid_methods.append("VoiceRestore(Pre)")
                         except Exception as e:
@@ -1067,15 +1288,7 @@ class VoxisPipeline:
                     # 3. Transformer Post-Pass (VoiceRestore)
                     if self.voicerestore_model is not None:
                         try:
-                            input_tensor = torch.from_numpy(channel_24k).float().unsqueeze(0).to(self.device)
-                            with torch.inference_mode():
-                                restored_tensor = self.voicerestore_model.forward(
-                                    input_tensor,
-                                    steps=self.voicerestore_steps,
-                                    cfg_strength=self.voicerestore_cfg,
-                                )
-                            channel_24k = restored_tensor.detach().cpu().squeeze(0).numpy()
-                            del input_tensor, restored_tensor
+                            channel_24k = self._voicerestore_forward(channel_24k)
                             if "VoiceRestore(Post)" not in hybrid_methods:
                                 hybrid_methods.append("VoiceRestore(Post)")
                         except Exception as e:
@@ -1087,21 +1300,27 @@ class VoxisPipeline:
                     else:
                         channel_audio = channel_24k
 
-                    processed_channels.append(channel_audio)
+                    # Length guard — model passes may drift by a few samples
+                    n = min(channel_audio.shape[-1], num_samples)
+                    processed_channels[i, :n] = channel_audio[:n]
+                    if n < num_samples:
+                        processed_channels[i, n:] = 0.0
 
-                denoised_audio = np.array(processed_channels)
+                denoised_audio = processed_channels
 
                 # ── SAFE CLIPPING PREVENTION ─────────────────────────────
                 max_val = np.max(np.abs(denoised_audio))
-                restore_rms_db = 20 * np.log10(np.sqrt(np.mean(denoised_audio ** 2)) + 1e-10)
-                print(f"RESTORE: peak={max_val:.4f}, RMS={restore_rms_db:.1f}dB")
+                restore_rms_db = _dbfs(_rms(denoised_audio))
+                logger.debug("RESTORE: peak=%.4f, RMS=%.1fdB", max_val, restore_rms_db)
 
                 if max_val > 1.0:
-                    np.tanh(denoised_audio, out=denoised_audio)
+                    # PERFORMANCE: Rational tanh(x) * 0.98 (same level, no libm call)
+                    _soft_clip_(denoised_audio, 1.0)
                     denoised_audio *= 0.98
-                    print(f"RESTORE: Soft-clipped peaks from {max_val:.3f} → {np.max(np.abs(denoised_audio)):.3f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("RESTORE: Soft-clipped peaks from %.3f → %.3f", max_val, np.max(np.abs(denoised_audio)))
                 elif max_val < 0.01 and max_val > 0:
-                    print(f"RESTORE: WARNING — near-silence ({max_val:.6f}), boosting")
+                    logger.warning("RESTORE: near-silence (%.6f), boosting", max_val)
                     denoised_audio = denoised_audio / max_val * 0.5
 
                 results["stages"]["hybrid_restore"] = {
@@ -1115,17 +1334,12 @@ class VoxisPipeline:
 
             update_progress("hybrid_restore", 100)
 
-            # PERFORMANCE: Only gc.collect() at major GPU boundary
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-            gc.collect()
-
             # ==============================================================
             # STAGE 7.5 — POST-RESTORE LOUDNESS RECOVERY
             # ==============================================================
-            post_rms = np.sqrt(np.mean(denoised_audio ** 2))
-            post_rms_db = 20 * np.log10(post_rms + 1e-10)
-            print(f"POST-RESTORE: RMS = {post_rms_db:.1f}dB, peak = {np.max(np.abs(denoised_audio)):.4f}")
+            post_rms_db = _dbfs(_rms(denoised_audio))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST-RESTORE: RMS = %.1fdB, peak = %.4f", post_rms_db, np.max(np.abs(denoised_audio)))
 
             if post_rms_db < -22.0:
                 denoised_audio, post_amp_details = self._dynamic_amplify(
@@ -1133,8 +1347,8 @@ class VoxisPipeline:
                     threshold_db=-22.0,
                     target_db=-14.0
                 )
-                new_rms_db = 20 * np.log10(np.sqrt(np.mean(denoised_audio ** 2)) + 1e-10)
-                print(f"POST-RESTORE AMP: {post_rms_db:.1f}dB → {new_rms_db:.1f}dB")
+                new_rms_db = _dbfs(_rms(denoised_audio))
+                logger.info("POST-RESTORE AMP: %.1fdB → %.1fdB", post_rms_db, new_rms_db)
                 results["stages"]["post_restore_amp"] = {
                     "applied": True,
                     "input_rms_db": round(post_rms_db, 1),
@@ -1149,12 +1363,15 @@ class VoxisPipeline:
             # ==============================================================
             update_progress("upscale", 0)
 
-            print(f"UPSCALE INPUT: peak={np.max(np.abs(denoised_audio)):.4f}, RMS={20*np.log10(np.sqrt(np.mean(denoised_audio**2))+1e-10):.1f}dB")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UPSCALE INPUT: peak=%.4f, RMS=%.1fdB", _peak(denoised_audio),
+                             _dbfs(_rms(denoised_audio)))
 
             if AUDIOSR_AVAILABLE and self.audiosr_model is not None and self.upscale_factor > 1:
                 tmp_input = None
                 try:
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False,
+                                                     dir=_scratch_dir(denoised_audio.nbytes)) as tmp:
                         tmp_input = tmp.name
                         sf.write(tmp_input, denoised_audio.T, current_sr)
 
@@ -1172,6 +1389,8 @@ class VoxisPipeline:
                         final_audio = final_audio.reshape(1, -1)
                     if final_audio.shape[0] > final_audio.shape[1] and final_audio.shape[1] <= 2:
                          final_audio = final_audio.T
+                    # Keep float32 end-to-end (AudioSR may hand back float64)
+                    final_audio = np.ascontiguousarray(final_audio, dtype=np.float32)
 
                     final_sr = self.target_sample_rate
                     results["stages"]["upscale"] = {
@@ -1211,33 +1430,33 @@ class VoxisPipeline:
             # ==============================================================
             if self.phaselimiter is not None:
                 update_progress("phaselimiter", 0)
-                pl_input = None
-                pl_output = None
                 try:
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                        pl_input = tmp.name
+                    # PhaseLimiter only accepts file paths, so hand off via tmpfs when
+                    # it fits both WAVs; the directory context removes them on exit
+                    with tempfile.TemporaryDirectory(prefix="voxis_pl_",
+                                                     dir=_scratch_dir(2 * final_audio.nbytes)) as pl_dir:
+                        pl_input = os.path.join(pl_dir, "input.wav")
+                        pl_output = os.path.join(pl_dir, "output.wav")
                         sf.write(pl_input, final_audio.T, final_sr)
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                        pl_output = tmp.name
-
-                    update_progress("phaselimiter", 20, {"message": "Voice mastering"})
-
-                    self.phaselimiter.process(
-                        pl_input, pl_output,
-                        mode="phase",
-                        ceiling=-0.1,
-                        ceiling_mode="true_peak",
-                        reference=-14.0,
-                        reference_mode="loudness",
-                        freq_expansion=True,
-                        freq_expansion_ratio=1.5,
-                        mastering=True,
-                        mastering_mode="classic"
-                    )
 
-                    update_progress("phaselimiter", 80)
-                    pl_audio, pl_sr = sf.read(pl_output, always_2d=True)
-                    final_audio = pl_audio.T
+                        update_progress("phaselimiter", 20, {"message": "Voice mastering"})
+
+                        self.phaselimiter.process(
+                            pl_input, pl_output,
+                            mode="phase",
+                            ceiling=-0.1,
+                            ceiling_mode="true_peak",
+                            reference=-14.0,
+                            reference_mode="loudness",
+                            freq_expansion=True,
+                            freq_expansion_ratio=1.5,
+                            mastering=True,
+                            mastering_mode="classic"
+                        )
+
+                        update_progress("phaselimiter", 80)
+                        pl_audio, pl_sr = sf.read(pl_output, dtype='float32', always_2d=True)
+                    final_audio = np.ascontiguousarray(pl_audio.T)
                     final_sr = pl_sr
 
                     results["stages"]["phaselimiter"] = {
@@ -1250,38 +1469,49 @@ class VoxisPipeline:
                 except Exception as e:
                     logger.error(f"PhaseLimiter failed: {e}. Continuing without mastering.")
                     results["stages"]["phaselimiter"] = {"error": str(e)}
-                finally:
-                    if pl_input and os.path.exists(pl_input): os.unlink(pl_input)
-                    if pl_output and os.path.exists(pl_output): os.unlink(pl_output)
 
                 update_progress("phaselimiter", 100)
 
             # Ensure correct channel count
             if final_audio.ndim == 1:
                 final_audio = final_audio.reshape(1, -1)
-            if self.target_channels == 2 and final_audio.shape[0] == 1:
-                final_audio = np.vstack([final_audio[0], final_audio[0]])
-            elif self.target_channels == 1 and final_audio.shape[0] == 2:
-                final_audio = np.mean(final_audio, axis=0, keepdims=True)
+            # PERFORMANCE: Mono→stereo is deferred to export as a broadcast view;
+            # the gain stages below run on the single mono channel (identical RMS/peak)
+            upmix_to_stereo = self.target_channels == 2 and final_audio.shape[0] == 1
+            if self.target_channels == 1 and final_audio.shape[0] == 2:
+                if final_audio.flags.writeable:
+                    # Downmix into row 0 in place — no N-sample allocation
+                    np.add(final_audio[0], final_audio[1], out=final_audio[0])
+                    final_audio[0] *= 0.5
+                    final_audio = final_audio[:1]
+                else:
+                    mono = np.add(final_audio[0], final_audio[1])
+                    mono *= 0.5
+                    final_audio = mono.reshape(1, -1)
 
             # ==============================================================
             # LOUDNESS SAFETY NET
             # ==============================================================
-            if "phaselimiter" not in results.get("stages", {}) or \
-               "error" in results.get("stages", {}).get("phaselimiter", {}):
-                final_rms = np.sqrt(np.mean(final_audio ** 2))
-                final_rms_db = 20 * np.log10(final_rms + 1e-10)
+            pl_stage = results["stages"].get("phaselimiter")
+            phaselimiter_ok = pl_stage is not None and "error" not in pl_stage
+            if not phaselimiter_ok:
+                # PERFORMANCE: Scalar math on a single-pass RMS (no x**2 temporary)
+                final_rms = _rms(final_audio)
+                final_rms_db = _dbfs(final_rms)
                 target_rms_db = -16.0
 
                 if final_rms_db < -24.0 and final_rms > 1e-10:
                     gain_db = min(target_rms_db - final_rms_db, 30.0)
                     gain_linear = 10 ** (gain_db / 20.0)
                     final_audio *= gain_linear
-                    peak = np.max(np.abs(final_audio))
-                    if peak > 0.98:
-                        final_audio = np.tanh(final_audio / 0.98) * 0.98
-                    new_rms_db = 20 * np.log10(np.sqrt(np.mean(final_audio ** 2)) + 1e-10)
-                    print(f"LOUDNESS SAFETY: Boosted {final_rms_db:.1f}dB → {new_rms_db:.1f}dB")
+                    # PERFORMANCE: Rational soft-clip instead of per-sample tanh
+                    if _peak(final_audio) > 0.98:
+                        _soft_clip_(final_audio, 0.98)
+                        new_rms_db = _dbfs(_rms(final_audio))
+                    else:
+                        # Pure linear gain — RMS scales exactly, skip the re-scan
+                        new_rms_db = final_rms_db + gain_db
+                    logger.info("LOUDNESS SAFETY: Boosted %.1fdB → %.1fdB", final_rms_db, new_rms_db)
                     results["stages"]["loudness_safety"] = {
                         "applied": True,
                         "input_rms_db": round(final_rms_db, 1),
@@ -1294,17 +1524,31 @@ class VoxisPipeline:
             # ==============================================================
             update_progress("export", 0)
 
-            # Peak-normalize to prevent clipping
-            max_val = np.max(np.abs(final_audio))
-            if max_val > 0.99:
-                final_audio *= (0.99 / max_val)
+            # Peak-normalize to prevent clipping. PhaseLimiter's -0.1 dBTP
+            # ceiling already guarantees this, so skip the scan after it.
+            export_gain = np.float32(1.0)
+            if not phaselimiter_ok:
+                max_val = _peak(final_audio)
+                if max_val > 0.99:
+                    export_gain = np.float32(0.99 / max_val)
 
             update_progress("export", 30, {"message": f"Writing {voxis_output_name}"})
 
-            sf.write(voxis_output_path, final_audio.T, final_sr, subtype="PCM_24")
+            if upmix_to_stereo:
+                final_audio = np.broadcast_to(final_audio, (2, final_audio.shape[1]))
+
+            # PERFORMANCE: Normalization gain is fused into the single
+            # interleaving copy at the write boundary (one pass, not two).
+            # Per-channel column fills read each channel sequentially instead
+            # of striding across channels for every frame.
+            interleaved = np.empty((final_audio.shape[1], final_audio.shape[0]), dtype=np.float32)
+            for ch in range(final_audio.shape[0]):
+                np.multiply(final_audio[ch], export_gain, out=interleaved[:, ch])
+            sf.write(voxis_output_path, interleaved, final_sr, subtype="PCM_24")
+            del interleaved
 
             if voxis_output_path != output_path:
-                shutil.copy2(voxis_output_path, output_path)
+                _clone_file(voxis_output_path, output_path)
 
             output_size = os.path.getsize(voxis_output_path)
 
@@ -1320,7 +1564,7 @@ class VoxisPipeline:
             }
 
             results["success"] = True
-            print(f"EXPORT: {voxis_output_name} | {final_sr}Hz | {final_audio.shape[0]}ch | {output_size/1024:.0f}KB")
+            logger.info("EXPORT: %s | %dHz | %dch | %.0fKB", voxis_output_name, final_sr, final_audio.shape[0], output_size / 1024)
             update_progress("export", 100)
 
             # Cleanup temp video extraction file
@@ -1335,6 +1579,19 @@ class VoxisPipeline:
             results["success"] = False
             import traceback
             results["traceback"] = traceback.format_exc()
+        finally:
+            # PERFORMANCE: Keep the CUDA caching allocator's blocks between
+            # runs — empty_cache() syncs the device and the next job would just
+            # cudaMalloc the same blocks again. Only release them when the GPU
+            # is nearly full (the single release point; eviction frees explicitly).
+            gc.collect()
+            if torch.cuda.is_available():
+                try:
+                    free, total = torch.cuda.mem_get_info()
+                    if free < total * CUDA_LOW_MEMORY_FRACTION:
+                        torch.cuda.empty_cache()
+                except RuntimeError:
+                    pass
 
         return results
 
@@ -58,7 +58,16 @@ if getattr(sys, 'frozen', False):
         os.environ["PATH"] = bin_path + os.pathsep + os.environ["PATH"]
 
 import uuid
+import re
 import json
+import hashlib
+import unicodedata
+from urllib.parse import quote
+import subprocess
+import tempfile
+import importlib.util
+import heapq
+import math
 import signal
 import threading
 import multiprocessing # For process isolation
@@ -70,32 +79,69 @@ except RuntimeError:
 import time
 import shutil
 import logging
+import logging.handlers
 import atexit
 import queue # For threading
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from functools import wraps
-from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Any, NamedTuple, Optional
+from functools import cache, lru_cache, partial, wraps
+from itertools import islice
+from contextlib import contextmanager
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # PERFORMANCE: Defer patch_torchaudio import — only needed when pipeline runs
 # It's imported inside the worker process instead of at server startup
 # This saves 3-5s of torch import time on server boot
 
-from flask import Flask, request, jsonify, send_file, send_from_directory, g
+# soundfile (libsndfile) is light and needed by upload/export handlers —
+# imported once here rather than inside each request
+import soundfile as sf
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, g, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+# Fast JSON encoding (optional — falls back to stdlib json via Flask)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Pre-encoded JSON splicing (orjson >= 3.9)
+    ORJSON_FRAGMENT = hasattr(orjson, 'Fragment')
+except ImportError:
+    ORJSON_AVAILABLE = False
+    ORJSON_FRAGMENT = False
+
+# Cython RLock tuned for the uncontended case (optional — threading.RLock fallback)
+try:
+    from fastrlock.rlock import RLock as FastRLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    FastRLock = threading.RLock
+    FASTRLOCK_AVAILABLE = False
+
+# Production WSGI server (optional — falls back to the Werkzeug dev server)
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Initialize structured logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.FileHandler("server.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+# PERFORMANCE: Request and worker threads only enqueue records; a single
+# QueueListener thread does the formatting and file/stdout writes.
+_log_formatter = logging.Formatter(
+    '%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
 )
+_log_handlers = [logging.FileHandler("server.log"), logging.StreamHandler(sys.stdout)]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
 logger = logging.getLogger('VOXIS')
 
 # PERFORMANCE: Lazy pipeline import — don't load PyTorch/models at server startup
@@ -103,53 +149,68 @@ logger = logging.getLogger('VOXIS')
 # This reduces server boot from ~15s to ~1s
 PIPELINE_AVAILABLE = True  # Assume available; worker will verify
 
-# STABILITY: Pre-load torch synchronously to prevent race conditions
-# The background thread approach failed, so we must block to ensure safe loading
-def preload_models():
-    """Import torch synchronously to populate sys.modules safely."""
-    try:
-        logging.info("PRELOAD: Starting synchronous model import...")
-        import torch
-        logging.info(f"PRELOAD: Torch {torch.__version__} ready")
-    except Exception as e:
-        logging.error(f"PRELOAD: Failed to load models: {e}")
-
-# Run synchronously before anything else
-preload_models()
-
 # Import worker entrypoint
 try:
-    from backend.worker import worker_process_entrypoint
+    from backend.worker import worker_process_entrypoint, warm_pipeline
 except ImportError:
     # Fallback if running from within backend dir
-    from worker import worker_process_entrypoint
+    from worker import worker_process_entrypoint, warm_pipeline
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-class Config:
-    """Server configuration with environment variable support."""
+class ResolvedPaths(NamedTuple):
+    """Filesystem layout, resolved once (see _resolve_paths)."""
+    base_dir: str
+    upload_folder: str
+    output_folder: str
+    static_folder: Optional[str]
 
-    # Paths — handle PyInstaller frozen mode
+
+@cache
+def _resolve_paths() -> ResolvedPaths:
+    """
+    Resolve base/upload/output/static paths for dev and PyInstaller frozen mode.
+    Memoized: the frozen-mode probes and directory stats run once per process.
+    """
     if getattr(sys, 'frozen', False):
         # PyInstaller onedir: executable is in dist/voxis_backend/
         # Data files are in dist/voxis_backend/_internal/
-        _exe_dir = os.path.dirname(sys.executable)
-        _internal = os.path.join(_exe_dir, '_internal')
-        BASE_DIR = _internal if os.path.isdir(_internal) else _exe_dir
+        exe_dir = os.path.dirname(sys.executable)
+        internal = os.path.join(exe_dir, '_internal')
+        base_dir = internal if os.path.isdir(internal) else exe_dir
         # Put uploads/outputs next to the executable, not inside _internal
-        _data_dir = os.environ.get('VOXIS_ROOT_PATH', _exe_dir)
-        UPLOAD_FOLDER = os.environ.get('VOXIS_UPLOAD_DIR', os.path.join(_data_dir, 'uploads'))
-        OUTPUT_FOLDER = os.environ.get('VOXIS_OUTPUT_DIR', os.path.join(_data_dir, 'outputs'))
+        data_dir = os.environ.get('VOXIS_ROOT_PATH', exe_dir)
+        # Frontend bundle lives under the PyInstaller extraction root
+        static = os.path.join(getattr(sys, '_MEIPASS', exe_dir), 'dist')
+        if not os.path.exists(static):
+            static = os.path.join(internal, 'dist')
     else:
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        UPLOAD_FOLDER = os.environ.get('VOXIS_UPLOAD_DIR', os.path.join(BASE_DIR, 'uploads'))
-        OUTPUT_FOLDER = os.environ.get('VOXIS_OUTPUT_DIR', os.path.join(BASE_DIR, 'outputs'))
+        base_dir = data_dir = os.path.dirname(os.path.abspath(__file__))
+        # Running locally in /backend
+        static = os.path.abspath(os.path.join(base_dir, '..', 'dist'))
+
+    return ResolvedPaths(
+        base_dir=base_dir,
+        upload_folder=os.environ.get('VOXIS_UPLOAD_DIR', os.path.join(data_dir, 'uploads')),
+        output_folder=os.environ.get('VOXIS_OUTPUT_DIR', os.path.join(data_dir, 'outputs')),
+        static_folder=static if os.path.exists(static) else None,
+    )
+
+
+class Config:
+    """Server configuration with environment variable support."""
+
+    # Paths — handle PyInstaller frozen mode
+    _paths = _resolve_paths()
+    BASE_DIR = _paths.base_dir
+    UPLOAD_FOLDER = _paths.upload_folder
+    OUTPUT_FOLDER = _paths.output_folder
     
     # File settings
     MAX_CONTENT_LENGTH = int(os.environ.get('VOXIS_MAX_FILE_SIZE', 500 * 1024 * 1024))  # 500MB
-    ALLOWED_EXTENSIONS = {'wav', 'mp3', 'flac', 'ogg', 'm4a', 'aac', 'wma', 'aiff', 'mp4', 'mov'}
+    ALLOWED_EXTENSIONS = frozenset({'wav', 'mp3', 'flac', 'ogg', 'm4a', 'aac', 'wma', 'aiff', 'mp4', 'mov'})
     
     # Rate limiting
     RATE_LIMIT_REQUESTS = int(os.environ.get('VOXIS_RATE_LIMIT', 30))  # requests per window
@@ -158,6 +219,9 @@ class Config:
     # Job settings
     JOB_TIMEOUT_HOURS = int(os.environ.get('VOXIS_JOB_TIMEOUT', 24))
     JOB_CLEANUP_INTERVAL = int(os.environ.get('VOXIS_CLEANUP_INTERVAL', 3600))  # 1 hour
+    MAX_CONCURRENT_JOBS = max(1, int(os.environ.get('VOXIS_MAX_CONCURRENT', 1)))  # pipelines running at once
+    MAX_QUEUED_JOBS = max(0, int(os.environ.get('VOXIS_MAX_QUEUED', 8)))          # waiting behind them
+    PRELOAD_PIPELINE = os.environ.get('VOXIS_PRELOAD_PIPELINE', 'false').lower() == 'true'  # load models at startup
     
     # Disk settings
     MIN_DISK_SPACE_GB = float(os.environ.get('VOXIS_MIN_DISK_GB', 1.0))
@@ -166,6 +230,11 @@ class Config:
     HOST = os.environ.get('VOXIS_HOST', '0.0.0.0')
     PORT = int(os.environ.get('VOXIS_PORT', 5002))
     DEBUG = os.environ.get('VOXIS_DEBUG', 'true').lower() == 'true'
+    HTTP_THREADS = max(1, int(os.environ.get('VOXIS_HTTP_THREADS', 8)))  # request I/O threads
+    # Let a fronting nginx/Apache stream file bodies (X-Sendfile / X-Accel-Redirect)
+    USE_X_SENDFILE = os.environ.get('VOXIS_X_SENDFILE', 'false').lower() == 'true'
+    # nginx: internal location aliased to OUTPUT_FOLDER (e.g. /_internal_output/)
+    X_ACCEL_PREFIX = os.environ.get('VOXIS_X_ACCEL_PREFIX', '').rstrip('/')
 
 config = Config()
 
@@ -178,28 +247,67 @@ os.makedirs(config.OUTPUT_FOLDER, exist_ok=True)
 # =============================================================================
 
 # Determine static folder
-static_folder = None
-if getattr(sys, 'frozen', False):
-    # Running inside PyInstaller bundle
-    if hasattr(sys, '_MEIPASS'):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(sys.executable)
-    static_folder = os.path.join(base_path, 'dist')
-    if not os.path.exists(static_folder):
-        static_folder = os.path.join(os.path.dirname(sys.executable), '_internal', 'dist')
-else:
-    # Running locally in /backend
-    static_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'dist'))
-
-if not os.path.exists(static_folder):
-    logger.warning(f"Static folder not found at {static_folder}. Frontend serving will be disabled.")
-    static_folder = None
+static_folder = _resolve_paths().static_folder
+if static_folder is None:
+    logger.warning("Static folder not found. Frontend serving will be disabled.")
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (encode and decode).
+    PERFORMANCE: C/SIMD encoder, and response() hands orjson's bytes straight
+    to the response without a str round-trip. Types orjson can't handle go
+    through Flask's default hook.
+    """
+
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+    def _encode(self, obj, indent=None) -> bytes:
+        option = self._OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._encode(obj, kwargs.get('indent')).decode()
+
+    def loads(self, s, **kwargs):
+        # request.get_json() parses through here too
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        indent = 2 if pretty else None
+        return self._app.response_class(self._encode(obj, indent), mimetype=self.mimetype)
+
 
 app = Flask(__name__, static_folder=static_folder, static_url_path='')
+if ORJSON_AVAILABLE:
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
 app.config['UPLOAD_FOLDER'] = config.UPLOAD_FOLDER
 app.config['OUTPUT_FOLDER'] = config.OUTPUT_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = config.MAX_CONTENT_LENGTH
+app.config['USE_X_SENDFILE'] = config.USE_X_SENDFILE
+
+def _index_static_files(root: str) -> frozenset:
+    """Relative POSIX paths of every file under `root` (one recursive scandir walk)."""
+    found = []
+    pending = ['']
+    while pending:
+        rel_dir = pending.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir():
+                    pending.append(rel)
+                elif entry.is_file():
+                    found.append(rel)
+    return frozenset(found)
+
+# PERFORMANCE: A frozen build's frontend bundle is immutable — index it once
+# so serve() answers with a set lookup instead of stat() calls per request.
+# Dev mode keeps the live filesystem check so frontend rebuilds show up.
+_STATIC_FILES = (_index_static_files(static_folder)
+                 if static_folder and getattr(sys, 'frozen', False) else None)
 
 # Serve React Frontend
 @app.route('/', defaults={'path': ''})
@@ -208,6 +316,11 @@ def serve(path):
     if path.startswith('api/'):
         return jsonify({'error': 'Not found'}), 404
         
+    if _STATIC_FILES is not None:
+        if path in _STATIC_FILES:
+            return send_from_directory(app.static_folder, path)
+        return send_from_directory(app.static_folder, 'index.html')
+        
     if app.static_folder and os.path.exists(app.static_folder):
         if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
             return send_from_directory(app.static_folder, path)
@@ -224,36 +337,76 @@ CORS(app, resources={r"/api/*": {"origins": "*"}})
 # =============================================================================
 
 class RateLimiter:
-    """Simple in-memory rate limiter per IP address."""
+    """Simple in-memory rate limiter per IP address (sliding window counter)."""
     
-    def __init__(self, max_requests: int, window_seconds: int):
+    def __init__(self, max_requests: int, window_seconds: int, num_shards: int = 16,
+                 max_tracked_ips: int = 100_000):
+        assert num_shards & (num_shards - 1) == 0, "num_shards must be a power of two"
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)
-        self.lock = threading.Lock()
+        # PERFORMANCE: Two-bucket sliding window — per IP just
+        # [window index, count in current window, count in previous window].
+        # O(1) time and memory per check instead of a timestamp per request.
+        # IPs are striped over independently locked shards so checks for
+        # different clients don't serialize on one mutex.
+        self._mask = num_shards - 1
+        self.shards = [(OrderedDict(), threading.Lock()) for _ in range(num_shards)]
+        # Each shard is an LRU bounded to its share of max_tracked_ips, so
+        # one-off client IPs can't grow the map forever
+        self._max_per_shard = max(1, max_tracked_ips // num_shards)
+    
+    def _shard(self, ip: str):
+        return self.shards[hash(ip) & self._mask]
+    
+    def _estimate(self, entry: list, now: float) -> float:
+        """Roll the buckets forward to `now` and return the weighted count."""
+        window, offset = divmod(now, self.window_seconds)
+        if entry[0] != window:
+            # Adjacent window: current becomes previous; otherwise both expired
+            entry[2] = entry[1] if window - entry[0] == 1 else 0
+            entry[0], entry[1] = window, 0
+        return entry[2] * (1.0 - offset / self.window_seconds) + entry[1]
     
     def is_allowed(self, ip: str) -> bool:
         """Check if request is allowed for given IP."""
-        with self.lock:
-            now = time.time()
-            window_start = now - self.window_seconds
-            
-            # Clean old requests
-            self.requests[ip] = [t for t in self.requests[ip] if t > window_start]
-            
-            if len(self.requests[ip]) >= self.max_requests:
+        now = time.time()
+        # PERFORMANCE: Lock-free fast path for the common case — an IP inside
+        # its current window and clearly under the limit. Element reads are
+        # atomic under the GIL; a racing `+= 1` can at worst lose a count,
+        # and the 2-request headroom keeps that from crossing the limit.
+        # Window roll-overs and near-limit checks take the lock.
+        requests, lock = self._shard(ip)
+        entry = requests.get(ip)
+        if entry is not None:
+            window, offset = divmod(now, self.window_seconds)
+            if entry[0] == window and \
+                    entry[2] * (1.0 - offset / self.window_seconds) + entry[1] < self.max_requests - 2:
+                entry[1] += 1
+                return True
+        
+        with lock:
+            entry = requests.get(ip)
+            if entry is None:
+                entry = requests[ip] = [0, 0, 0]
+                if len(requests) > self._max_per_shard:
+                    requests.popitem(last=False)  # least recently checked IP
+            else:
+                # Recency is refreshed on the locked path, i.e. at least once
+                # per window per active IP (window roll-over always lands here)
+                requests.move_to_end(ip)
+            if self._estimate(entry, now) >= self.max_requests:
                 return False
-            
-            self.requests[ip].append(now)
+            entry[1] += 1
             return True
     
     def get_remaining(self, ip: str) -> int:
         """Get remaining requests for IP."""
-        with self.lock:
-            now = time.time()
-            window_start = now - self.window_seconds
-            current = len([t for t in self.requests[ip] if t > window_start])
-            return max(0, self.max_requests - current)
+        requests, lock = self._shard(ip)
+        with lock:
+            entry = requests.get(ip)
+            if entry is None:
+                return self.max_requests
+            return max(0, self.max_requests - math.ceil(self._estimate(entry, time.time())))
 
 rate_limiter = RateLimiter(config.RATE_LIMIT_REQUESTS, config.RATE_LIMIT_WINDOW)
 
@@ -275,135 +428,714 @@ def rate_limit(f):
 # JOB MANAGEMENT
 # =============================================================================
 
-jobs = {}
-jobs_lock = threading.RLock()
-server_stats = {
-    'start_time': datetime.utcnow().isoformat(),
-    'total_uploads': 0,
-    'total_jobs': 0,
-    'completed_jobs': 0,
-    'failed_jobs': 0,
-    'bytes_processed': 0
-}
+class ShardedJobStore:
+    """
+    Job records striped across independently locked shards.
+
+    PERFORMANCE: Progress updates and status polls for different jobs lock
+    different shards, so they don't serialize on one global lock. Aggregate
+    scans hold one shard lock at a time. Per-shard status indexes
+    (status -> set of job ids) are kept in step with every insert/transition/
+    removal, so status counts and status-filtered listings never walk the
+    records.
+
+    index_status=False turns the store into a plain sharded map for values
+    that are not job dicts (no 'status' key); the status methods then
+    report nothing.
+    """
+
+    def __init__(self, num_shards: int = 16, index_status: bool = True):
+        assert num_shards & (num_shards - 1) == 0, "num_shards must be a power of two"
+        self._mask = num_shards - 1
+        self._index_status = index_status
+        self.shards = [({}, FastRLock()) for _ in range(num_shards)]
+        self._status_index = [defaultdict(set) for _ in range(num_shards)]
+        # Insertion-ordered job id -> creation sequence; newest at the end
+        self._order: Dict[str, int] = {}
+        self._order_seq = 0
+        self._order_lock = threading.Lock()
+
+    def _shard(self, job_id: str):
+        return self.shards[hash(job_id) & self._mask]
+
+    def _index(self, job_id: str) -> defaultdict:
+        return self._status_index[hash(job_id) & self._mask]
+
+    @contextmanager
+    def locked(self, job_id: str):
+        """Hold the owning shard lock; yields the live job record (or None)."""
+        shard, lock = self._shard(job_id)
+        with lock:
+            yield shard.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        shard, lock = self._shard(job_id)
+        with lock:
+            return shard.get(job_id)
+
+    def peek(self, job_id: str) -> Optional[dict]:
+        """
+        Lock-free shallow snapshot of a job record (None if absent).
+        PERFORMANCE: dict.get and dict.copy are single C calls under the GIL,
+        so pollers never wait on (or block) a writer. The snapshot may be one
+        update behind — fine for read-only status views.
+        """
+        job = self._shard(job_id)[0].get(job_id)
+        return job.copy() if job is not None else None
+
+    def peek_live(self, job_id: str) -> Optional[dict]:
+        """Lock-free reference to the live record — only for GIL-atomic single-key writes."""
+        return self._shard(job_id)[0].get(job_id)
+
+    def set(self, job_id: str, record: dict):
+        shard, lock = self._shard(job_id)
+        index = self._index(job_id)
+        with lock:
+            previous = shard.get(job_id)
+            if self._index_status:
+                if previous is not None:
+                    index[previous['status']].discard(job_id)
+                index[record['status']].add(job_id)
+            shard[job_id] = record
+        if previous is None:
+            with self._order_lock:
+                self._order_seq += 1
+                self._order[job_id] = self._order_seq
+
+    def set_status(self, job: dict, status: str):
+        """Transition a live job record's status (call inside `locked()`)."""
+        job_id = job['job_id']
+        _, lock = self._shard(job_id)
+        index = self._index(job_id)
+        with lock:
+            index[job['status']].discard(job_id)
+            index[status].add(job_id)
+            job['status'] = status
+
+    def update(self, job_id: str, **fields) -> bool:
+        """Update fields of an existing job. Returns False if it is gone."""
+        shard, lock = self._shard(job_id)
+        with lock:
+            job = shard.get(job_id)
+            if job is None:
+                return False
+            job.update(fields)
+            return True
+
+    def delete(self, job_id: str) -> Optional[dict]:
+        """Remove and return a job record (None if absent)."""
+        shard, lock = self._shard(job_id)
+        with lock:
+            job = shard.pop(job_id, None)
+            if job is not None and self._index_status:
+                self._index(job_id)[job['status']].discard(job_id)
+        if job is not None:
+            with self._order_lock:
+                self._order.pop(job_id, None)
+        return job
+
+    def values(self) -> list:
+        """Snapshot of all job records."""
+        snapshot = []
+        for shard, lock in self.shards:
+            with lock:
+                snapshot.extend(shard.values())
+        return snapshot
+
+    def pop_if(self, job_id: str, predicate) -> Optional[dict]:
+        """Remove and return a job record only if predicate(job) is true."""
+        _, lock = self._shard(job_id)
+        with lock:  # reentrant: delete() re-takes the same shard lock
+            job = self._shard(job_id)[0].get(job_id)
+            if job is None or not predicate(job):
+                return None
+            return self.delete(job_id)
+
+    def pop_where(self, predicate) -> list:
+        """Remove and return every job record for which predicate(job) is true."""
+        removed = []
+        for (shard, lock), index in zip(self.shards, self._status_index):
+            with lock:
+                for job_id in [jid for jid, job in shard.items() if predicate(job)]:
+                    job = shard.pop(job_id)
+                    if self._index_status:
+                        index[job['status']].discard(job_id)
+                    removed.append((job_id, job))
+        if removed:
+            with self._order_lock:
+                for job_id, _ in removed:
+                    self._order.pop(job_id, None)
+        return [job for _, job in removed]
+
+    def newest(self, limit: int, status: Optional[str] = None) -> list:
+        """
+        Up to `limit` most recently created job records, optionally by status.
+        PERFORMANCE: Unfiltered, walks the creation-order index from the
+        newest end and stops at `limit`. Filtered, takes the top `limit` of
+        just that status's id set by creation sequence (O(M log limit)).
+        No snapshot or sort of the whole store either way.
+        """
+        if status is None:
+            with self._order_lock:
+                job_ids = list(islice(reversed(self._order), limit))
+        else:
+            candidates = self.ids_with_status(status)
+            with self._order_lock:
+                order = self._order
+                job_ids = heapq.nlargest(limit, (j for j in candidates if j in order), key=order.__getitem__)
+        # Hydrate outside the index lock with lock-free snapshots
+        records = []
+        for job_id in job_ids:
+            job = self.peek(job_id)
+            if job is not None and (status is None or job['status'] == status):
+                records.append(job)
+        return records
+
+    def ids_with_status(self, status: str) -> list:
+        """Ids of every job currently in `status` (from the status index)."""
+        job_ids = []
+        for (_, lock), index in zip(self.shards, self._status_index):
+            with lock:
+                job_ids.extend(index.get(status, ()))
+        return job_ids
+
+    def status_counts(self) -> Counter:
+        """Number of jobs per status, summed over the shard indexes."""
+        total = Counter()
+        for (_, lock), index in zip(self.shards, self._status_index):
+            with lock:
+                for status, job_ids in index.items():
+                    total[status] += len(job_ids)
+        return total
+
+job_store = ShardedJobStore(num_shards=16)
+
+
+class ServerStats:
+    """
+    Server-wide counters behind their own tiny lock.
+
+    PERFORMANCE: Counter bumps never take a job-store shard lock. Writers
+    serialize on the (rarely contended) lock because `+=` is a read-modify-
+    write; readers take none — dict.copy() of int values is a single C call
+    under the GIL, so /stats polls never wait on a writer.
+    """
+
+    COUNTERS = ('total_uploads', 'total_jobs', 'completed_jobs', 'failed_jobs', 'bytes_processed')
+
+    def __init__(self):
+        self.start_ts = time.time()
+        self.start_time = datetime.utcfromtimestamp(self.start_ts).isoformat()
+        self._counts = dict.fromkeys(self.COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> dict:
+        return {'start_time': self.start_time, **self._counts.copy()}
+
+server_stats = ServerStats()
+
+# PERFORMANCE: Authoritative file_id -> (path, size) index, filled at upload
+# and pruned when the file is deleted, so /api/process resolves inputs
+# without touching the filesystem. Striped like the job table so uploads
+# and job creation don't contend on one lock. Values are tuples, not job
+# dicts, so no status index.
+upload_index = ShardedJobStore(num_shards=16, index_status=False)
+
+# PERFORMANCE: Ids are uuid4().hex — generated without str() formatting and
+# validated by one precompiled regex instead of a uuid.UUID() parse. The
+# check also keeps path separators out of ids used in filenames.
+_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+def is_valid_id(value) -> bool:
+    """True for a job/file id as issued by this server (32 lowercase hex chars)."""
+    return isinstance(value, str) and _ID_RE.fullmatch(value) is not None
+
+def register_upload(file_id: str, filepath: str, size: int):
+    """Record where an upload landed on disk."""
+    upload_index.set(file_id, (filepath, size))
+
+def forget_upload(file_id: Optional[str]):
+    """Drop an upload from the index once its file is removed."""
+    if file_id:
+        upload_index.delete(file_id)
+
+def find_upload(file_id: str) -> Optional[str]:
+    """Resolve an uploaded file path by id (index first, one directory scan on miss)."""
+    entry = upload_index.get(file_id)
+    if entry is not None:
+        return entry[0]
+
+    # Index miss (e.g. server restarted). Uploads are normalized to WAV at
+    # ingest, so one stat of the expected name settles almost every case.
+    wav_path = os.path.join(config.UPLOAD_FOLDER, f"{file_id}.wav")
+    try:
+        size = os.stat(wav_path).st_size
+    except OSError:
+        pass
+    else:
+        register_upload(file_id, wav_path, size)
+        return wav_path
+
+    # Legacy non-WAV uploads — single listing of the upload folder
+    prefix = f"{file_id}."
+    with os.scandir(config.UPLOAD_FOLDER) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.is_file():
+                ext = entry.name[len(prefix):].lower()
+                if ext in _ALLOWED:
+                    register_upload(file_id, entry.path, entry.stat().st_size)
+                    return entry.path
+    return None
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+def save_upload_stream(storage, filepath: str) -> str:
+    """
+    Stream an uploaded FileStorage to disk in 1 MB chunks, hashing as it goes.
+    Returns the SHA-256 hex digest of the uploaded bytes.
+    """
+    # PERFORMANCE: Large buffered chunks keep the per-MB Python overhead low,
+    # and hashlib releases the GIL on big updates
+    digest = hashlib.sha256()
+    stream = storage.stream
+
+    with open(filepath, 'wb', buffering=UPLOAD_CHUNK_SIZE) as fh:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            fh.write(chunk)
+    return digest.hexdigest()
+
+# Every upload is normalized to 48 kHz stereo 16-bit PCM WAV by ffmpeg.
+# -bitexact drops the encoder LIST chunk, leaving the canonical 44-byte header.
+INGEST_SAMPLERATE = 48000
+INGEST_CHANNELS = 2
+INGEST_FRAME_BYTES = INGEST_CHANNELS * 2
+WAV_HEADER_BYTES = 44
+FFMPEG_WAV_ARGS = ('-vn', '-map_metadata', '-1', '-fflags', '+bitexact', '-flags:a', '+bitexact',
+                   '-acodec', 'pcm_s16le', '-ar', str(INGEST_SAMPLERATE), '-ac', str(INGEST_CHANNELS))
+
+def ingest_wav_info(wav_path: str):
+    """
+    (frames, duration_seconds) of a WAV written with FFMPEG_WAV_ARGS.
+
+    PERFORMANCE: The format is fixed by us, so one stat() replaces
+    sf.info()'s open + header parse on every upload.
+    """
+    frames = max(0, os.path.getsize(wav_path) - WAV_HEADER_BYTES) // INGEST_FRAME_BYTES
+    return frames, frames / INGEST_SAMPLERATE
+# Containers whose index can sit at the end of the file — ffmpeg must seek,
+# so these are never fed through a pipe
+_SEEK_REQUIRED_EXTS = frozenset({'mp4', 'mov', 'm4a', 'wma'})
+
+FFMPEG_STDERR_TAIL = 4096
+
+def run_ffmpeg(cmd: list):
+    """
+    Run an ffmpeg command to completion, raising CalledProcessError on failure.
+
+    PERFORMANCE: stderr goes to an unlinked temp file rather than a PIPE, so
+    the server never drains it on success; only the last FFMPEG_STDERR_TAIL
+    bytes are read back, and only when ffmpeg fails.
+    """
+    with tempfile.TemporaryFile() as err:
+        returncode = subprocess.call(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                     stderr=err, bufsize=UPLOAD_CHUNK_SIZE)
+        if returncode:
+            err.seek(max(0, err.seek(0, os.SEEK_END) - FFMPEG_STDERR_TAIL))
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=err.read())
+
+def _ffmpeg_to_wav(source: str, wav_path: str):
+    """Convert a file on disk to the standard ingest WAV (raises CalledProcessError)."""
+    run_ffmpeg(['ffmpeg', '-y', '-loglevel', 'error', '-i', source, *FFMPEG_WAV_ARGS, wav_path])
+
+def ingest_upload_to_wav(storage, ext: str, wav_path: str, temp_path: str) -> str:
+    """
+    Convert an uploaded FileStorage straight to the ingest WAV at wav_path.
+    Returns the SHA-256 hex digest of the uploaded bytes.
+
+    PERFORMANCE: No intermediate copy of the upload on the common path —
+    the body is streamed into ffmpeg's stdin while hashing. Only containers
+    that need seeking go through temp_path.
+    """
+    stream = storage.stream
+    if ext in _SEEK_REQUIRED_EXTS:
+        checksum = save_upload_stream(storage, temp_path)
+        try:
+            _ffmpeg_to_wav(temp_path, wav_path)
+        finally:
+            remove_job_file(temp_path)
+        return checksum
+
+    digest = hashlib.sha256()
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', 'pipe:0', *FFMPEG_WAV_ARGS, wav_path]
+    # stderr goes to a file, not a pipe: nobody drains it while we write stdin
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=err, bufsize=UPLOAD_CHUNK_SIZE)
+        try:
+            for chunk in iter(lambda: stream.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                proc.stdin.write(chunk)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early — its return code and stderr say why
+        returncode = proc.wait()
+        if returncode:
+            err.seek(max(0, err.seek(0, os.SEEK_END) - FFMPEG_STDERR_TAIL))
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=err.read())
+    return digest.hexdigest()
+
+# Resolved once at import: bare-global lookups on the per-upload path
+_ALLOWED = frozenset(e.lower() for e in config.ALLOWED_EXTENSIONS)
+_ALLOWED_LIST = sorted(_ALLOWED)
+_EXT_MAX_LEN = max(map(len, _ALLOWED))
 
 def allowed_file(filename: str) -> bool:
     """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in config.ALLOWED_EXTENSIONS
+    # rfind + slice avoids rsplit's list allocation; over-long suffixes are
+    # rejected before slicing/lowercasing
+    dot = filename.rfind('.')
+    if dot == -1 or len(filename) - dot - 1 > _EXT_MAX_LEN:
+        return False
+    return filename[dot + 1:].lower() in _ALLOWED
+
+# PERFORMANCE: statfs result is memoized briefly — health/stats polling
+# doesn't need a fresh syscall on every request
+DISK_SPACE_TTL = 5.0  # seconds
+# (expires, value), replaced as a whole so readers need no lock
+_disk_space_cache = (0.0, None)
+_disk_space_lock = threading.Lock()
 
 def get_disk_space() -> dict:
-    """Get disk space information."""
+    """Get disk space information (cached for DISK_SPACE_TTL seconds)."""
+    global _disk_space_cache
+    now = time.monotonic()
+    expires, value = _disk_space_cache
+    if now < expires:
+        return value
+    # One refresher at a time; late arrivals reuse its result
+    with _disk_space_lock:
+        expires, value = _disk_space_cache
+        if now < expires:
+            return value
+        _disk_space_cache = (now + DISK_SPACE_TTL, _read_disk_space())
+        return _disk_space_cache[1]
+
+def _read_disk_space() -> dict:
+    """statvfs the data volume (uncached)."""
     try:
         total, used, free = shutil.disk_usage(config.BASE_DIR)
-        return {
+        disk = {
             'total_gb': round(total / (1024**3), 2),
             'used_gb': round(used / (1024**3), 2),
             'free_gb': round(free / (1024**3), 2),
             'percent_used': round((used / total) * 100, 1)
         }
     except Exception:
-        return {'error': 'Unable to get disk space'}
+        disk = {'error': 'Unable to get disk space'}
+    return disk
 
 def check_disk_space() -> bool:
-    """Check if there's enough disk space."""
-    disk = get_disk_space()
+    """Check if there's enough disk space (always a fresh read; refreshes the cache)."""
+    global _disk_space_cache
+    disk = _read_disk_space()
+    _disk_space_cache = (time.monotonic() + DISK_SPACE_TTL, disk)
     if 'error' in disk:
         return True  # Don't block if we can't check
     return disk['free_gb'] >= config.MIN_DISK_SPACE_GB
 
-def update_job_status(job_id: str, stage: str, progress: int, **kwargs):
-    """Thread-safe job status update."""
-    with jobs_lock:
-        if job_id in jobs:
-            jobs[job_id]['current_stage'] = stage
-            jobs[job_id]['progress'] = progress
-            jobs[job_id]['updated_at'] = datetime.utcnow().isoformat()
-            jobs[job_id]['stages'][stage] = {
-                'progress': progress,
-                'updated_at': datetime.utcnow().isoformat(),
-                **kwargs
-            }
-            logger.info(f"Job {job_id[:8]} | Stage: {stage} | Progress: {progress}%")
+def iso_utc(ts: float) -> str:
+    """Format an epoch-seconds timestamp as a naive-UTC ISO string for the API."""
+    return datetime.utcfromtimestamp(ts).isoformat()
+
+# PERFORMANCE: "now" as ISO text, formatted at most once per second.
+# [epoch second, formatted]; a racing stale read under the GIL is harmless.
+_ts_cache = [0, '']
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string (second granularity, memoized)."""
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[1] = datetime.utcfromtimestamp(sec).isoformat()
+        _ts_cache[0] = sec
+    return _ts_cache[1]
+
+def update_job_status(job_id: str, stage: str, progress: int, timestamp: Optional[float] = None, **kwargs):
+    """Thread-safe job status update. `timestamp` is epoch seconds (defaults to now)."""
+    with job_store.locked(job_id) as job:
+        if job is None:
+            return
+        # Nothing moved — skip the dict writes and log line
+        if not kwargs and job['current_stage'] == stage and job['progress'] == progress:
+            return
+        # PERFORMANCE: Stored as epoch floats; ISO formatting happens only
+        # when a status response is built (iso_utc)
+        now = timestamp if timestamp is not None else time.time()
+        job['current_stage'] = stage
+        job['progress'] = progress
+        job['updated_at'] = now
+        job['stages'][stage] = {
+            'progress': progress,
+            'updated_at': now,
+            **kwargs
+        }
+        job['stages_rev'] += 1
+        # Hot path: no string work at all unless INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Job %s | Stage: %s | Progress: %s%%", job_id[:8], stage, progress)
+
+class JobUpdateQueue:
+    """
+    Worker -> monitor message queue: a deque plus one wake-up Event.
+    PERFORMANCE: deque append/popleft are atomic in CPython, so producers pay
+    no lock/Condition round-trip; the monitor wakes once and drains a batch.
+    Progress ticks skip the queue entirely (see put).
+    """
 
-# Global queue for job updates (Worker -> Main Process)
-# Must be at module level for pickling (even with threads)
-job_updates_queue = queue.Queue()
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
 
+    def put(self, msg: tuple):
+        if msg[0] == 'progress':
+            # ('progress', job_id, stage, progress): only the latest matters,
+            # so overwrite the job's slot — one dict store, no deque entry and
+            # no monitor wake-up; the periodic flush picks it up
+            progress_slots[msg[1]] = (msg[2], msg[3], time.time())
+            return
+        self._items.append(msg)
+        self._ready.set()
+
+    def drain(self, timeout: float, max_items: int):
+        """Wait up to `timeout` for messages, then yield up to `max_items` of them."""
+        if not self._items:
+            self._ready.wait(timeout)
+        # Clear before draining: a put() racing the drain re-sets the event.
+        # Anything left past max_items makes the next drain return at once.
+        self._ready.clear()
+        items = self._items
+        for _ in range(max_items):
+            if not items:
+                break
+            yield items.popleft()
+
+# Global queue for job updates (worker threads -> monitor thread).
+# In-process only: if workers ever move to processes, feed this from a
+# spawn-context multiprocessing.Queue via a bridge thread so the monitor
+# keeps a single code path.
+job_updates_queue = JobUpdateQueue()
+
+# PERFORMANCE: Latest progress per job as (stage, progress, epoch seconds).
+# Workers overwrite their slot per tick without locking (single dict store,
+# JobUpdateQueue.put) and the monitor flushes slots into the job store every
+# PROGRESS_FLUSH_INTERVAL, so bursts of ticks cost one shard-lock
+# acquisition per job per flush.
+progress_slots: Dict[str, tuple] = {}
+PROGRESS_FLUSH_INTERVAL = 0.25
+
+def flush_progress(job_id: Optional[str] = None):
+    """Apply pending progress slots (all jobs, or just one) to the job store."""
+    job_ids = [job_id] if job_id is not None else list(progress_slots)
+    for jid in job_ids:
+        slot = progress_slots.pop(jid, None)
+        if slot is not None:
+            stage, progress, ts = slot
+            update_job_status(jid, stage, progress, timestamp=ts)
+
+
+# PERFORMANCE: Bounded worker pool — each job owns the GPU/model cache, so
+# running more than MAX_CONCURRENT_JOBS at once only thrashes VRAM and caches.
+# Extra jobs wait in the executor queue (capped in start_processing).
+job_executor = ThreadPoolExecutor(
+    max_workers=config.MAX_CONCURRENT_JOBS,
+    thread_name_prefix='VoxisWorker'
+)
 
-# Track active worker processes for crash detection
+# In-flight job futures (job_id -> Future); removed by on_worker_done
 active_processes = {}
 
+# PERFORMANCE: Transcoded exports are cached on disk per (job, format, quality)
+# so repeat downloads skip ffmpeg. Striped locks stop concurrent requests for
+# the same export from transcoding it twice; a fixed array never grows with
+# the number of exports (unrelated keys rarely share a stripe).
+TRANSCODE_FOLDER = os.path.join(config.OUTPUT_FOLDER, '_transcoded')
+os.makedirs(TRANSCODE_FOLDER, exist_ok=True)
+TRANSCODE_LOCK_STRIPES = 64  # power of two
+_transcode_locks = [threading.Lock() for _ in range(TRANSCODE_LOCK_STRIPES)]
+
+def _transcode_lock(key: str) -> threading.Lock:
+    return _transcode_locks[hash(key) & (TRANSCODE_LOCK_STRIPES - 1)]
+
+# PERFORMANCE: Directory fds for the folders job files live in — unlink by
+# basename relative to an open dir (unlinkat) instead of resolving the full
+# path on every delete. Not available on Windows; falls back to os.remove.
+_job_dir_fds: Dict[str, int] = {}
+if os.unlink in os.supports_dir_fd:
+    for _folder in (config.UPLOAD_FOLDER, config.OUTPUT_FOLDER, TRANSCODE_FOLDER):
+        try:
+            _job_dir_fds[os.path.abspath(_folder)] = os.open(_folder, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            pass
+
+# PERFORMANCE: Bulk deletes run on one background reaper thread so a slow
+# filesystem never stalls the caller (cleanup sweep, shutdown, DELETE requests)
+file_reaper = ThreadPoolExecutor(max_workers=1, thread_name_prefix='VoxisFileReaper')
+
+def _reap_files(filepaths: list, reason: str):
+    removed = sum(remove_job_file(filepath) for filepath in filepaths)
+    logger.info(f"File reaper ({reason}): {removed}/{len(filepaths)} files removed")
+
+def schedule_file_removal(filepaths: list, reason: str):
+    """Queue files for deletion on the reaper thread."""
+    filepaths = [f for f in filepaths if f]
+    if filepaths:
+        file_reaper.submit(_reap_files, filepaths, reason)
+
+def remove_job_file(filepath: Optional[str]) -> bool:
+    """Delete a job file. Returns True if a file was removed."""
+    if not filepath:
+        return False
+    folder, name = os.path.split(os.path.abspath(filepath))
+    dir_fd = _job_dir_fds.get(folder)
+    try:
+        if dir_fd is not None:
+            os.unlink(name, dir_fd=dir_fd)
+        else:
+            os.remove(filepath)
+        return True
+    except OSError:
+        return False
+
+# PERFORMANCE: Min-heap of (completed_at_ts, job_id) so cleanup pops only
+# the jobs that actually expired instead of scanning every record.
+_job_expiry_heap: list = []
+_job_expiry_lock = threading.Lock()
+
+def mark_finished(job: dict):
+    """Stamp a job's completion time and schedule it for expiry (call under its shard lock)."""
+    now = time.time()
+    job['completed_at'] = _now_iso()
+    job['completed_at_ts'] = now
+    with _job_expiry_lock:
+        heapq.heappush(_job_expiry_heap, (now, job['job_id']))
+
+def apply_job_messages(job_id: str, msgs: list):
+    """
+    Apply a job's non-progress worker messages to the job store, in order.
+    PERFORMANCE: One shard-lock acquisition per job per monitor batch.
+    """
+    # Land any pending progress before a state transition
+    flush_progress(job_id)
+    
+    counted_outcomes = []
+    with job_store.locked(job_id) as job:
+        if job is None:
+            return # Job might have been deleted
+        
+        for msg in msgs:
+            msg_type = msg[0]
+            if msg_type == 'status':
+                job_store.set_status(job, msg[2])
+            elif msg_type == 'started':
+                job['started_at'] = msg[2]  # epoch seconds; ISO only in responses
+            elif msg_type == 'complete':
+                # ('complete', job_id, results, output_path)
+                results = msg[2]
+                output_path = msg[3]
+                # Inline completion detection may have counted it already
+                if job['status'] != 'complete':
+                    counted_outcomes.append(('completed_jobs', output_path))
+                job_store.set_status(job, 'complete')
+                job['results'] = results
+                job['output_file'] = output_path
+                mark_finished(job)
+                logger.info("Job %s | Marked COMPLETE in main process", job_id[:8])
+            elif msg_type == 'error':
+                # ('error', job_id, error_msg)
+                job_store.set_status(job, 'error')
+                job['error'] = msg[2]
+                mark_finished(job)
+                counted_outcomes.append(('failed_jobs', None))
+                logger.error("Job %s | Marked ERROR: %s", job_id[:8], msg[2])
+    
+    # Stats (and the output stat() syscall) outside the shard lock
+    for counter, output_path in counted_outcomes:
+        server_stats.incr(counter)
+        if output_path is not None and os.path.exists(output_path):
+            server_stats.incr('bytes_processed', os.path.getsize(output_path))
+
+# Max worker messages handled per monitor wake-up
+MONITOR_BATCH_SIZE = 64
+
+# /api/events streams wait here; the monitor notifies after applying changes.
+# Each open stream holds an HTTP thread, so at most half the pool may stream
+# (the rest stays free for uploads/downloads; extra clients fall back to polling).
+# HTTP_THREADS matches the server's pool: waitress is given it directly and
+# both gunicorn confs export their `threads` as VOXIS_HTTP_THREADS.
+job_changed = threading.Condition()
+_job_change_seq = 0  # bumped per notification, so streams never miss one
+_event_streams = 0
+MAX_EVENT_STREAMS = config.HTTP_THREADS // 2  # 0 on a single thread: poll only
+EVENT_HEARTBEAT_SECONDS = 15.0
+
+def notify_job_watchers():
+    """Wake /api/events streams (no-op when nobody is streaming)."""
+    global _job_change_seq
+    if _event_streams:
+        with job_changed:
+            _job_change_seq += 1
+            job_changed.notify_all()
+
+def on_worker_done(job_id: str, future):
+    """
+    Future done-callback: untrack the job and report escaped exceptions.
+    PERFORMANCE: Crash detection is event-driven — no periodic scan of
+    active_processes in the monitor loop.
+    """
+    active_processes.pop(job_id, None)
+    # The worker reports its own outcome on the queue; only an exception
+    # escaping it means a crash. Routing it through the queue keeps it
+    # ordered after any messages the worker already sent.
+    exc = None if future.cancelled() else future.exception()
+    if exc is not None:
+        logger.error(f"Job {job_id[:8]} | DETECTED CRASH: {exc}")
+        job_updates_queue.put(('error', job_id, f"Worker thread died unexpectedly: {exc}"))
+
 def run_job_monitor():
-    """Background thread to consume updates from worker processes AND monitor for crashes."""
+    """Background thread to consume updates from worker threads and apply them."""
     logger.info("Job Monitor thread started")
     
-    last_process_check = time.time()
+    last_progress_flush = time.time()
     
     while True:
         try:
-            # excessive blocking prevents shutdown? use timeout
-            try:
-                # Short timeout to allow process checking loop to run frequently
-                msg = job_updates_queue.get(timeout=0.5)
+            # Short timeout so progress flushes run on time.
+            # Transitions are grouped per job so each job's shard lock is taken
+            # once per batch, not once per message.
+            transitions: Dict[str, list] = {}
+            # (progress ticks never arrive here — they land in progress_slots)
+            for msg in job_updates_queue.drain(PROGRESS_FLUSH_INTERVAL, MONITOR_BATCH_SIZE):
+                transitions.setdefault(msg[1], []).append(msg)
+            for job_id, msgs in transitions.items():
+                apply_job_messages(job_id, msgs)
+            changed = bool(transitions)
                 
-                msg_type = msg[0]
-                job_id = msg[1]
-                
-                with jobs_lock:
-                    if job_id not in jobs:
-                        continue # Job might have been deleted
-                    
-                    if msg_type == 'status':
-                        jobs[job_id]['status'] = msg[2]
-                    elif msg_type == 'started':
-                        jobs[job_id]['started_at'] = msg[2]
-                    elif msg_type == 'progress':
-                        # ('progress', job_id, stage, progress)
-                        update_job_status(job_id, msg[2], msg[3])
-                    elif msg_type == 'complete':
-                        # ('complete', job_id, results, output_path)
-                        results = msg[2]
-                        output_path = msg[3]
-                        jobs[job_id]['status'] = 'complete'
-                        jobs[job_id]['results'] = results
-                        jobs[job_id]['output_file'] = output_path
-                        jobs[job_id]['completed_at'] = datetime.utcnow().isoformat()
-                        server_stats['completed_jobs'] += 1
-                        if os.path.exists(output_path):
-                            server_stats['bytes_processed'] += os.path.getsize(output_path)
-                        logger.info(f"Job {job_id[:8]} | Marked COMPLETE in main process")
-                    elif msg_type == 'error':
-                        # ('error', job_id, error_msg)
-                        jobs[job_id]['status'] = 'error'
-                        jobs[job_id]['error'] = msg[2]
-                        jobs[job_id]['completed_at'] = datetime.utcnow().isoformat()
-                        server_stats['failed_jobs'] += 1
-                        logger.error(f"Job {job_id[:8]} | Marked ERROR: {msg[2]}")
-                        
-            except queue.Empty:
-                pass
-                
-            # Check for dead processes every ~0.5s
             current_time = time.time()
-            if current_time - last_process_check > 0.5:
-                # Copy keys to avoid modification during iteration
-                for job_id, proc in list(active_processes.items()):
-                    if not proc.is_alive():
-                        # Thread is dead. Check status.
-                        with jobs_lock:
-                            # Only update if the job was still expected to be processing
-                            if job_id in jobs and jobs[job_id]['status'] in ['queued', 'processing']:
-                                error_msg = "Worker thread died unexpectedly"
-                                jobs[job_id]['status'] = 'error'
-                                jobs[job_id]['error'] = error_msg
-                                jobs[job_id]['completed_at'] = datetime.utcnow().isoformat()
-                                server_stats['failed_jobs'] += 1
-                                logger.error(f"Job {job_id[:8]} | DETECTED CRASH: {error_msg}")
-                        
-                        # Cleanup from active dict regardless of job status update
-                        del active_processes[job_id]
-                        
-                last_process_check = current_time
-                    
+            if current_time - last_progress_flush >= PROGRESS_FLUSH_INTERVAL:
+                changed = changed or bool(progress_slots)
+                flush_progress()
+                last_progress_flush = current_time
+            
+            if changed:
+                notify_job_watchers()
+                
         except Exception as e:
             logger.error(f"Monitor error: {e}")
             time.sleep(1)
@@ -427,41 +1159,75 @@ def start_background_tasks():
         # Start Cleanup Scheduler (re-using existing logic)
         start_cleanup_scheduler()
         
+        # Optionally load models on a pool thread now, so the first job
+        # doesn't pay the model load (HTTP startup is not blocked)
+        if config.PRELOAD_PIPELINE:
+            job_executor.submit(warm_pipeline)
+        
         _bg_tasks_started = True
 
 def cleanup_old_jobs():
     """Remove old completed/failed jobs and their files."""
     logger.info("Running job cleanup...")
-    cutoff = datetime.utcnow() - timedelta(hours=config.JOB_TIMEOUT_HOURS)
-    
-    jobs_to_remove = []
-    files_removed = 0
-    
-    with jobs_lock:
-        for job_id, job in jobs.items():
-            completed_at = job.get('completed_at')
-            if completed_at:
+    # PERFORMANCE: Numeric epoch compare — no ISO parsing per job per sweep
+    cutoff_ts = time.time() - config.JOB_TIMEOUT_HOURS * 3600
+    
+    def is_expired(job):
+        completed_at_ts = job.get('completed_at_ts')
+        return completed_at_ts is not None and completed_at_ts < cutoff_ts
+    
+    # Only heap entries older than the cutoff are candidates (O(k log N))
+    candidates = []
+    with _job_expiry_lock:
+        while _job_expiry_heap and _job_expiry_heap[0][0] < cutoff_ts:
+            candidates.append(heapq.heappop(_job_expiry_heap)[1])
+    
+    # Re-check each record: it may be gone (deleted) or stamped again later.
+    # File removal happens unlocked.
+    expired_jobs = []
+    for job_id in candidates:
+        job = job_store.pop_if(job_id, is_expired)
+        if job is not None:
+            expired_jobs.append(job)
+    
+    filepaths = []
+    for job in expired_jobs:
+        forget_upload(job.get('file_id'))
+        # Files (including cached exports) are unlinked on the reaper thread
+        filepaths.extend(f for f in (job.get('input_file'), job.get('output_file'), *job.get('exports', ())) if f)
+    
+    # Uploads that never became a job are invisible to the heap above —
+    # sweep them with one directory listing
+    filepaths.extend(find_orphan_uploads(cutoff_ts, already_queued=filepaths))
+    schedule_file_removal(filepaths, reason="cleanup")
+    
+    logger.info(f"Cleanup complete: {len(expired_jobs)} jobs expired, {len(filepaths)} file paths queued for removal")
+
+def find_orphan_uploads(cutoff_ts: float, already_queued=()) -> list:
+    """
+    Upload files older than cutoff_ts that no live job references.
+    PERFORMANCE: One os.scandir pass (DirEntry carries the name/type, one
+    stat per file) cross-referenced against a set of live job inputs,
+    instead of probing paths one by one.
+    """
+    referenced = {job.get('input_file') for job in job_store.values()}
+    referenced.update(already_queued)
+    orphans = []
+    try:
+        with os.scandir(config.UPLOAD_FOLDER) as entries:
+            for entry in entries:
+                if entry.path in referenced or not entry.is_file():
+                    continue
                 try:
-                    job_time = datetime.fromisoformat(completed_at)
-                    if job_time < cutoff:
-                        jobs_to_remove.append(job_id)
-                        
-                        # Remove files
-                        for file_key in ['input_file', 'output_file']:
-                            filepath = job.get(file_key)
-                            if filepath and os.path.exists(filepath):
-                                try:
-                                    os.remove(filepath)
-                                    files_removed += 1
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-        
-        for job_id in jobs_to_remove:
-            del jobs[job_id]
-    
-    logger.info(f"Cleanup complete: {len(jobs_to_remove)} jobs, {files_removed} files removed")
+                    if entry.stat().st_mtime >= cutoff_ts:
+                        continue
+                except OSError:
+                    continue
+                forget_upload(entry.name.partition('.')[0])
+                orphans.append(entry.path)
+    except OSError as e:
+        logger.warning(f"Upload sweep failed: {e}")
+    return orphans
 
 def start_cleanup_scheduler():
     """Start background cleanup thread."""
@@ -481,6 +1247,10 @@ def start_cleanup_scheduler():
 # REQUEST LOGGING MIDDLEWARE
 # =============================================================================
 
+# Polling endpoints are only logged when slow or failing
+QUIET_PATH_PREFIXES = ('/api/health', '/api/status/')
+SLOW_REQUEST_MS = 50.0
+
 @app.before_request
 def before_request():
     """Log incoming requests."""
@@ -488,13 +1258,17 @@ def before_request():
     if not _bg_tasks_started:
         start_background_tasks()
         
-    g.start_time = time.time()
+    g.start_ns = time.perf_counter_ns()
 
 @app.after_request
 def after_request(response):
-    """Log request completion with timing."""
-    duration = time.time() - getattr(g, 'start_time', time.time())
-    logger.info(f"{request.method} {request.path} | {response.status_code} | {duration*1000:.1f}ms")
+    """Log request completion with timing (sampled for polling endpoints)."""
+    start_ns = getattr(g, 'start_ns', None)
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6 if start_ns is not None else 0.0
+    if (duration_ms > SLOW_REQUEST_MS or response.status_code >= 400
+            or not request.path.startswith(QUIET_PATH_PREFIXES)):
+        # Lazy %-formatting: skipped entirely if INFO is filtered out
+        logger.info("%s %s | %d | %.1fms", request.method, request.path, response.status_code, duration_ms)
     return response
 
 # =============================================================================
@@ -529,36 +1303,38 @@ def internal_error(e):
 def health_check():
     """Comprehensive health check with system stats."""
     disk = get_disk_space()
+    now_iso = _now_iso()  # one clock read serves both time fields
     
     return jsonify({
         'status': 'healthy',
-        'server_time': datetime.utcnow().isoformat(),
+        'server_time': now_iso,
         'service': 'VOXIS',
         'version': '4.0.0',
         'powered_by': 'Trinity v8.1',
         'built_by': 'Glass Stone',
-        'timestamp': datetime.utcnow().isoformat(),
-        'uptime_seconds': (datetime.utcnow() - datetime.fromisoformat(server_stats['start_time'])).total_seconds(),
+        'timestamp': now_iso,
+        'uptime_seconds': time.time() - server_stats.start_ts,
         'disk': disk,
         'pipeline_available': PIPELINE_AVAILABLE,
-        'active_jobs': len([j for j in jobs.values() if j['status'] == 'processing'])
+        'active_jobs': job_store.status_counts()['processing']
     })
 
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get server statistics."""
-    with jobs_lock:
-        job_summary = {
-            'total': len(jobs),
-            'queued': len([j for j in jobs.values() if j['status'] == 'queued']),
-            'processing': len([j for j in jobs.values() if j['status'] == 'processing']),
-            'complete': len([j for j in jobs.values() if j['status'] == 'complete']),
-            'error': len([j for j in jobs.values() if j['status'] == 'error'])
-        }
+    # PERFORMANCE: O(shards) read of the maintained counters, no record scan
+    counts = job_store.status_counts()
+    job_summary = {
+        'total': sum(counts.values()),
+        'queued': counts['queued'],
+        'processing': counts['processing'],
+        'complete': counts['complete'],
+        'error': counts['error']
+    }
     
     return jsonify({
-        'server': server_stats,
+        'server': server_stats.snapshot(),
         'jobs': job_summary,
         'disk': get_disk_space(),
         'rate_limit': {
@@ -571,6 +1347,23 @@ def get_stats():
 @app.route('/api/system/models', methods=['GET'])
 def get_model_status():
     """Get status of AI models."""
+    return jsonify(_model_status(int(time.monotonic() // MODEL_STATUS_TTL)))
+
+
+# PERFORMANCE: Model files only change on install/download — probe the
+# filesystem at most once per MODEL_STATUS_TTL instead of on every request
+MODEL_STATUS_TTL = 30.0  # seconds
+
+# Checked once via the import system's finder — importing audio_separator
+# here would pull in torch at server startup
+try:
+    SHARDING_AVAILABLE = importlib.util.find_spec('audio_separator') is not None
+except (ImportError, ValueError):
+    SHARDING_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _model_status(ttl_bucket: int) -> dict:
+    """Probe model files; memoized per TTL bucket (the argument is the cache key)."""
     models_dir = os.path.join(config.BASE_DIR, 'models')
     
     # Check Trinity Upscale (AudioSR)
@@ -598,13 +1391,8 @@ def get_model_status():
     }
 
     # Check VOXIS Sharding (Neural Separation)
-    try:
-        from audio_separator.separator import Separator
-        sharding_available = True
-    except ImportError:
-        sharding_available = False
     sharding_status = {
-        'available': sharding_available,
+        'available': SHARDING_AVAILABLE,
         'model': 'VOXIS Sharding',
         'engine': 'VOXIS 4.0.0 by Glass Stone'
     }
@@ -617,7 +1405,7 @@ def get_model_status():
         'model': 'Trinity Diffusion'
     }
 
-    return jsonify({
+    return {
         'audiosr': audiosr_status,
         'deepfilternet': df_status,
         'sharding': sharding_status,
@@ -625,7 +1413,7 @@ def get_model_status():
         'diffusion': diff_status,
         'pipeline_loaded': PIPELINE_AVAILABLE,
         'mode': 'always_on',
-    })
+    }
 
 
 @app.route('/api/upload', methods=['POST'])
@@ -648,26 +1436,23 @@ def upload_file():
     if not allowed_file(file.filename):
         return jsonify({
             'error': 'Invalid file type',
-            'allowed': list(config.ALLOWED_EXTENSIONS)
+            'allowed': _ALLOWED_LIST
         }), 400
     
     try:
         # Generate unique filename
-        file_id = str(uuid.uuid4())
+        file_id = uuid.uuid4().hex
         original_filename = secure_filename(file.filename)
-        ext = original_filename.rsplit('.', 1)[1].lower() if '.' in original_filename else 'wav'
+        # Extension from the raw name (validated by allowed_file): secure_filename
+        # drops the dot from non-ASCII names, which would misroute seek-only containers
+        ext = file.filename[file.filename.rfind('.') + 1:].lower()
         filename = f"{file_id}.{ext}"
         
-        # Security: Validate content
-        import soundfile as sf
-        
-        # Save to temp location first for validation
+        # Temp location, only used for containers ffmpeg can't read from a pipe
         temp_filename = f"temp_{filename}"
         temp_filepath = os.path.join(config.UPLOAD_FOLDER, temp_filename)
         final_filepath = os.path.join(config.UPLOAD_FOLDER, filename)
         
-        file.save(temp_filepath)
-        
         # Always use ffmpeg for ingestion to ensure standardized robust 48kHz WAV
         needs_ffmpeg = True
         is_video = ext in {'mp4', 'mov'} # Preserve stats
@@ -676,35 +1461,32 @@ def upload_file():
             if needs_ffmpeg:
                 # Convert immediately using ffmpeg
                 # This prevents torchaudio/librosa segfaults in worker threads
-                import subprocess
                 wav_filename = f"{file_id}.wav"
                 wav_filepath = os.path.join(config.UPLOAD_FOLDER, wav_filename)
                 
-                convert_cmd = ['ffmpeg', '-y', '-i', temp_filepath, '-vn', '-acodec', 'pcm_s16le', '-ar', '48000', '-ac', '2', wav_filepath]
-                
                 try:
-                    subprocess.run(convert_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                    checksum = ingest_upload_to_wav(file, ext, wav_filepath, temp_filepath)
                     
                     # Update info
-                    if os.path.exists(temp_filepath):
-                        os.remove(temp_filepath)
                     final_filepath = wav_filepath
                     filename = wav_filename
                     ext = 'wav'
                     
-                    # Get info from new WAV
-                    info = sf.info(final_filepath)
-                    duration = info.duration
-                    samplerate = info.samplerate
-                    channels = info.channels
+                    # Get info from new WAV — format is fixed by the conversion
+                    frames, duration = ingest_wav_info(final_filepath)
+                    if frames == 0:
+                        raise ValueError("Empty audio file")
+                    samplerate = INGEST_SAMPLERATE
+                    channels = INGEST_CHANNELS
                     
                 except subprocess.CalledProcessError as e:
-                    raise ValueError(f"Video conversion failed: {e.stderr.decode()}")
+                    raise ValueError(f"Video conversion failed: {e.stderr.decode(errors='replace')}")
                 except Exception as e:
                     raise ValueError(f"Conversion error: {e}")
 
             else:
                 # Verify it's a valid audio file
+                checksum = save_upload_stream(file, temp_filepath)
                 info = sf.info(temp_filepath)
                 if info.frames == 0:
                     raise ValueError("Empty audio file")
@@ -717,14 +1499,15 @@ def upload_file():
                 raise ValueError("File duration exceeds 2 hours limit")
 
         except Exception as e:
-            if os.path.exists(temp_filepath):
-                os.remove(temp_filepath)
+            for leftover in (temp_filepath, os.path.join(config.UPLOAD_FOLDER, f"{file_id}.wav")):
+                remove_job_file(leftover)
             logger.warning(f"Invalid upload rejected: {original_filename} | {e}")
             return jsonify({'error': 'Invalid file content', 'details': str(e)}), 400
 
         file_size = os.path.getsize(final_filepath)
+        register_upload(file_id, final_filepath, file_size)
 
-        server_stats['total_uploads'] += 1
+        server_stats.incr('total_uploads')
         source_type = 'video' if is_video else 'audio'
         logger.info(f"Upload complete: {file_id[:8]} | {original_filename} | {source_type} | {file_size/1024:.1f}KB | {samplerate}Hz | {channels}ch")
 
@@ -737,7 +1520,8 @@ def upload_file():
             'channels': channels,
             'samplerate': samplerate,
             'source': source_type,
-            'uploaded_at': datetime.utcnow().isoformat()
+            'sha256': checksum,
+            'uploaded_at': _now_iso()
         })
         
     except Exception as e:
@@ -756,41 +1540,37 @@ def upload_recording():
         return jsonify({'error': 'No audio blob provided', 'field': 'audio'}), 400
 
     audio_blob = request.files['audio']
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     filename = f"{file_id}.wav"
     filepath = os.path.join(config.UPLOAD_FOLDER, filename)
 
     try:
         temp_filepath = os.path.join(config.UPLOAD_FOLDER, f"temp_{filename}")
-        audio_blob.save(temp_filepath)
-        
         # Convert blob immediately using ffmpeg to ensure 2-channel 48kHz WAV
-        import subprocess
-        convert_cmd = ['ffmpeg', '-y', '-i', temp_filepath, '-vn', '-acodec', 'pcm_s16le', '-ar', '48000', '-ac', '2', filepath]
-        subprocess.run(convert_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-        if os.path.exists(temp_filepath):
-            os.remove(temp_filepath)
-
-        import soundfile as sf
-        info = sf.info(filepath)
-        if info.frames == 0:
+        # (MediaRecorder blobs are WebM/Ogg/WAV — all pipe-readable)
+        checksum = ingest_upload_to_wav(audio_blob, 'wav', filepath, temp_filepath)
+
+        frames, duration = ingest_wav_info(filepath)
+        if frames == 0:
             os.remove(filepath)
             return jsonify({'error': 'Empty recording'}), 400
 
         file_size = os.path.getsize(filepath)
-        server_stats['total_uploads'] += 1
-        logger.info(f"Recording upload: {file_id[:8]} | {info.duration:.1f}s | {info.samplerate}Hz")
+        register_upload(file_id, filepath, file_size)
+        server_stats.incr('total_uploads')
+        logger.info(f"Recording upload: {file_id[:8]} | {duration:.1f}s | {INGEST_SAMPLERATE}Hz")
 
         return jsonify({
             'success': True,
             'file_id': file_id,
             'filename': f'recording_{file_id[:8]}.wav',
             'size': file_size,
-            'duration': info.duration,
-            'channels': info.channels,
-            'samplerate': info.samplerate,
+            'duration': duration,
+            'channels': INGEST_CHANNELS,
+            'samplerate': INGEST_SAMPLERATE,
             'source': 'recording',
-            'uploaded_at': datetime.utcnow().isoformat()
+            'sha256': checksum,
+            'uploaded_at': _now_iso()
         })
     except Exception as e:
         if os.path.exists(filepath):
@@ -815,21 +1595,25 @@ def start_processing():
     file_id = data['file_id']
     
     # Validate file_id format (UUID)
-    try:
-        uuid.UUID(file_id)
-    except ValueError:
+    if not is_valid_id(file_id):
         return jsonify({'error': 'Invalid file_id format'}), 400
     
     # Find the uploaded file
-    input_path = None
-    for ext in config.ALLOWED_EXTENSIONS:
-        potential_path = os.path.join(config.UPLOAD_FOLDER, f"{file_id}.{ext}")
-        if os.path.exists(potential_path):
-            input_path = potential_path
-            break
+    input_path = find_upload(file_id)
     
     if not input_path:
         return jsonify({'error': 'File not found', 'file_id': file_id}), 404
+
+    # Backpressure: refuse new work once the pool and its queue are full
+    # Finished futures untrack themselves (on_worker_done), so this is the backlog
+    pending_jobs = len(active_processes)
+    if pending_jobs >= config.MAX_CONCURRENT_JOBS + config.MAX_QUEUED_JOBS:
+        logger.warning(f"Job queue full ({pending_jobs} pending) — rejecting request")
+        return jsonify({
+            'error': 'Server busy',
+            'pending_jobs': pending_jobs,
+            'retry_after': 30
+        }), 503, {'Retry-After': '30'}
     
     # Validate and sanitize config
     try:
@@ -856,7 +1640,7 @@ def start_processing():
         return jsonify({'error': 'Invalid configuration', 'message': str(e)}), 400
     
     # Create job
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     output_filename = f"voxis_restored_{job_id}.wav"
     output_path = os.path.join(config.OUTPUT_FOLDER, output_filename)
     
@@ -866,53 +1650,49 @@ def start_processing():
         # Try to infer from uploaded file
         original_filename_raw = os.path.basename(input_path)
     original_name_stem = os.path.splitext(original_filename_raw)[0]
-    # Strip UUID prefix if present (36 chars UUID)
-    if len(original_name_stem) == 36 and '-' in original_name_stem:
+    # Strip UUID name if present (32 hex chars)
+    if is_valid_id(original_name_stem):
         original_name_stem = f"audio_{file_id[:8]}"
 
-    with jobs_lock:
-        jobs[job_id] = {
-            'job_id': job_id,
-            'file_id': file_id,
-            'status': 'queued',
-            'filename': output_filename,
-            'input_file': input_path,
-            'output_file': output_path,
-            'original_name': original_name_stem,
-            'config': job_config,
-            'created_at': datetime.utcnow().isoformat(),
-            'started_at': None,
-            'completed_at': None,
-            'updated_at': datetime.utcnow().isoformat(),
-            'progress': 0,
-            'current_stage': 'queued',
-            'stages': {},
-            'results': None,
-            'error': None
-        }
-        server_stats['total_jobs'] += 1
+    job_store.set(job_id, {
+        'job_id': job_id,
+        'file_id': file_id,
+        'status': 'queued',
+        'filename': output_filename,
+        'input_file': input_path,
+        'output_file': output_path,
+        'original_name': original_name_stem,
+        'config': job_config,
+        'created_at': _now_iso(),
+        'started_at': None,
+        'completed_at': None,
+        'updated_at': time.time(),
+        'progress': 0,
+        'current_stage': 'queued',
+        'stages': {},
+        'stages_rev': 0,
+        'stages_cache': None,
+        'results': None,
+        'error': None
+    })
+    server_stats.incr('total_jobs')
     
-    # Start processing in DETACHED MULTIPROCESSING PROCESS
-    # This prevents SIGSEGV crashes from killing the server
+    # Submit to the bounded worker pool (threads — multiprocessing.Process
+    # causes spawn issues on this env). Stays 'queued' until a worker picks it up.
     try:
-        # Start processing in THREAD (for debugging stability)
-        # multiprocessing.Process causes spawn issues on this env
-        process = threading.Thread(
-            target=worker_process_entrypoint,
-            args=(job_id, input_path, output_path, job_config, job_updates_queue),
-            daemon=True
+        future = job_executor.submit(
+            worker_process_entrypoint,
+            job_id, input_path, output_path, job_config, job_updates_queue
         )
-        # print(f"DEBUG TYPE: {type(process)}")
-        # sys.stdout.flush()
-        process.start()
     except Exception as e:
-        logger.exception(f"Job {job_id[:8]} | process.start() failed: {e}")
+        logger.exception(f"Job {job_id[:8]} | executor.submit() failed: {e}")
         return jsonify({'error': 'Failed to spawn worker process', 'details': str(e)}), 500
     
-    # Track process for crash monitoring
-    active_processes[job_id] = process
+    # Track the future for cancellation; crash detection fires on completion
+    active_processes[job_id] = future
+    future.add_done_callback(partial(on_worker_done, job_id))
     
-    logger.info(f"Job {job_id[:8]} | Spawning worker thread ident {process.ident}")
+    logger.info(f"Job {job_id[:8]} | Submitted to worker pool")
     
     return jsonify({
         'success': True,
@@ -922,61 +1702,150 @@ def start_processing():
     })
 
 
+@app.route('/api/events/<job_id>', methods=['GET'])
+def job_events(job_id):
+    """
+    Server-sent events for one job: an event per state change, ending after
+    the terminal (complete/error) event.
+    PERFORMANCE: Replaces once-a-second status polling with one request per
+    job; the stream sleeps on job_changed between monitor updates.
+    """
+    global _event_streams
+    if not is_valid_id(job_id):
+        return jsonify({'error': 'Invalid job_id format'}), 400
+    if job_store.peek(job_id) is None:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+    with job_changed:
+        if _event_streams >= MAX_EVENT_STREAMS:
+            return jsonify({'error': 'Too many event streams, poll /api/status instead'}), 503
+        _event_streams += 1
+
+    def stream():
+        global _event_streams
+        last = None
+        try:
+            while True:
+                seen_seq = _job_change_seq
+                job = job_store.peek(job_id)
+                if job is None:
+                    yield 'event: deleted\ndata: {}\n\n'
+                    return
+                state = (job['status'], job['current_stage'], job['progress'], job['error'])
+                if state != last:
+                    last = state
+                    payload = app.json.dumps({
+                        'job_id': job_id,
+                        'status': state[0],
+                        'current_stage': state[1],
+                        'progress': state[2],
+                        'error': state[3],
+                        'completed_at': job['completed_at'],
+                    })
+                    yield f"data: {payload}\n\n"
+                    if state[0] in ('complete', 'error'):
+                        return
+                # Never yield while holding job_changed — a slow client would stall the monitor
+                with job_changed:
+                    woke = job_changed.wait_for(lambda: _job_change_seq != seen_seq,
+                                                EVENT_HEARTBEAT_SECONDS)
+                if not woke:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ': keep-alive\n\n'
+        finally:
+            with job_changed:
+                _event_streams -= 1
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 @app.route('/api/status/<job_id>', methods=['GET'])
 def get_job_status(job_id):
     """Get processing job status."""
     # Validate job_id format
-    try:
-        uuid.UUID(job_id)
-    except ValueError:
+    if not is_valid_id(job_id):
         return jsonify({'error': 'Invalid job_id format'}), 400
     
-    with jobs_lock:
-        job = jobs.get(job_id)
+    # Read-only poll: lock-free snapshot (inline completion below re-checks under the lock)
+    job = job_store.peek(job_id)
     
     if not job:
         return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
     
     # Inline completion detection: if job still shows processing but output exists, mark complete
-    # This is a fallback for when the monitor thread can't keep up
-    if job['status'] in ['queued', 'processing']:
+    # This is a fallback for when the monitor thread can't keep up.
+    # Only once the worker has returned (its future untracks itself): skips a
+    # stat() per poll while running, and never races a half-written export.
+    if job['status'] in ['queued', 'processing'] and job_id not in active_processes:
         output_file = job.get('output_file', '')
         if output_file and os.path.exists(output_file):
-            with jobs_lock:
-                if job_id in jobs and jobs[job_id]['status'] in ['queued', 'processing']:
+            marked_complete = False
+            with job_store.locked(job_id) as live_job:
+                if live_job is not None and live_job['status'] in ['queued', 'processing']:
                     logger.info(f"Job {job_id[:8]} | Inline completion detection - output file exists")
-                    jobs[job_id]['status'] = 'complete'
-                    jobs[job_id]['completed_at'] = datetime.utcnow().isoformat()
-                    server_stats['completed_jobs'] += 1
-                    server_stats['bytes_processed'] += os.path.getsize(output_file)
-                    job = jobs[job_id]  # Refresh for response
+                    job_store.set_status(live_job, 'complete')
+                    mark_finished(live_job)
+                    marked_complete = True
+                    job = live_job.copy()  # respond with the new state
+            if marked_complete:
+                server_stats.incr('completed_jobs')
+                server_stats.incr('bytes_processed', os.path.getsize(output_file))
+    
+    # Newest progress may still be sitting in its slot (flushed every 250 ms)
+    current_stage, progress = job['current_stage'], job['progress']
+    slot = progress_slots.get(job_id)
+    if slot is not None:
+        current_stage, progress = slot[0], slot[1]
+    
+    stages = stages_payload(job_id, job)
     
     return jsonify({
         'job_id': job['job_id'],
         'status': job['status'],
-        'current_stage': job['current_stage'],
-        'progress': job['progress'],
-        'stages': job['stages'],
+        'current_stage': current_stage,
+        'progress': progress,
+        'stages': stages,
         'config': job['config'],
         'error': job['error'],
         'created_at': job['created_at'],
-        'started_at': job['started_at'],
+        'started_at': iso_utc(job['started_at']) if job['started_at'] is not None else None,
         'completed_at': job['completed_at'],
         'results': job.get('results')
     })
 
 
+def stages_payload(job_id: str, job: dict):
+    """
+    The `stages` field of a status response, built once per stages revision.
+    PERFORMANCE: Pollers re-read the same stages many times between updates;
+    the ISO conversion (and, with orjson, the encoding — as a Fragment) is
+    reused until update_job_status bumps stages_rev. The cache is tagged
+    with its revision, so a racing stale write can never be served.
+    """
+    rev = job['stages_rev']
+    cached = job['stages_cache']
+    if cached is not None and cached[0] == rev:
+        return cached[1]
+    payload = {
+        name: {**info, 'updated_at': iso_utc(info['updated_at'])}
+        for name, info in list(job['stages'].items())
+    }
+    if ORJSON_FRAGMENT:
+        payload = orjson.Fragment(orjson.dumps(payload, option=OrjsonProvider._OPTIONS))
+    live_job = job_store.peek_live(job_id)
+    if live_job is not None:
+        live_job['stages_cache'] = (rev, payload)  # single dict store, atomic under the GIL
+    return payload
+
+
 @app.route('/api/download/<job_id>', methods=['GET'])
 def download_file(job_id):
     """Download processed audio file."""
     # Validate job_id format
-    try:
-        uuid.UUID(job_id)
-    except ValueError:
+    if not is_valid_id(job_id):
         return jsonify({'error': 'Invalid job_id format'}), 400
     
-    with jobs_lock:
-        job = jobs.get(job_id)
+    job = job_store.peek(job_id)
     
     if not job:
         return jsonify({'error': 'Job not found'}), 404
@@ -999,14 +1868,68 @@ def download_file(job_id):
     download_name = f"{orig_name}-voxis.wav"
     logger.info(f"Download: {job_id[:8]} | {download_name}")
 
+    return send_audio_file(job['output_file'], 'audio/wav', download_name)
+
+
+def send_audio_file(path: str, mimetype: str, download_name: str):
+    """
+    Send a finished audio file with HTTP validators.
+    PERFORMANCE: conditional=True answers If-None-Match / If-Modified-Since with
+    304 and serves Range requests, so retries never re-send the whole file.
+    Behind nginx (VOXIS_X_ACCEL_PREFIX), outputs are handed off with
+    X-Accel-Redirect instead: nginx sendfile()s them and handles Range/304,
+    and no HTTP thread is held for the transfer.
+    """
+    if config.X_ACCEL_PREFIX:
+        rel = os.path.relpath(path, config.OUTPUT_FOLDER)
+        if not rel.startswith(os.pardir):
+            return accel_redirect(f"{config.X_ACCEL_PREFIX}/{quote(rel.replace(os.sep, '/'))}",
+                                  mimetype, download_name)
     return send_file(
-        job['output_file'],
-        mimetype='audio/wav',
+        path,
+        mimetype=mimetype,
         as_attachment=True,
-        download_name=download_name
+        download_name=download_name,
+        conditional=True,
+        etag=True,
+        last_modified=os.path.getmtime(path)
     )
 
 
+def accel_redirect(internal_uri: str, mimetype: str, download_name: str):
+    """Empty response telling nginx to serve `internal_uri` as an attachment."""
+    response = Response(status=200, mimetype=mimetype)
+    try:
+        download_name.encode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=download_name)
+    except UnicodeEncodeError:
+        # Same RFC 6266 fallback Flask's send_file uses
+        simple = unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=simple,
+                             **{'filename*': f"UTF-8''{quote(download_name, safe='!#$&+^`|~')}"})
+    response.headers['X-Accel-Redirect'] = internal_uri
+    return response
+
+
+def export_cache_key(job_id: str, export_format: str, variant: str) -> str:
+    """Stable cache key for a transcoded export (BLAKE2b, 64-bit digest)."""
+    return hashlib.blake2b(f"{job_id}:{export_format}:{variant}".encode(),
+                           digest_size=8).hexdigest()
+
+
+def _encode_flac(wav_path: str, flac_path: str):
+    """
+    Losslessly re-encode a WAV as FLAC in-process via libsndfile.
+    PERFORMANCE: Streams integer PCM blocks — no ffmpeg spawn, no float round-trip.
+    """
+    with sf.SoundFile(wav_path) as src:
+        subtype = src.subtype if src.subtype in ('PCM_16', 'PCM_24') else 'PCM_24'
+        with sf.SoundFile(flac_path, 'w', samplerate=src.samplerate, channels=src.channels,
+                          format='FLAC', subtype=subtype) as dst:
+            for block in src.blocks(blocksize=1 << 16, dtype='int32'):
+                dst.write(block)
+
+
 @app.route('/api/export/<job_id>', methods=['GET'])
 def export_file(job_id):
     """
@@ -1017,13 +1940,10 @@ def export_file(job_id):
       - quality: 'low', 'medium', 'high' (for MP3 bitrate)
     """
     # Validate job_id format
-    try:
-        uuid.UUID(job_id)
-    except ValueError:
+    if not is_valid_id(job_id):
         return jsonify({'error': 'Invalid job_id format'}), 400
     
-    with jobs_lock:
-        job = jobs.get(job_id)
+    job = job_store.peek(job_id)
     
     if not job:
         return jsonify({'error': 'Job not found'}), 404
@@ -1057,26 +1977,17 @@ def export_file(job_id):
     # If WAV, just send the original file
     if export_format == 'wav':
         download_name = f"{original_name}-voxis.wav"
-        return send_file(
-            job['output_file'],
-            mimetype='audio/wav',
-            as_attachment=True,
-            download_name=download_name
-        )
+        return send_audio_file(job['output_file'], 'audio/wav', download_name)
     
     # For FLAC/MP3, convert using ffmpeg directly instead of pydub
     try:
-        import subprocess
-        
-        # Create temp output file
         output_ext = export_format
         output_filename = f"{original_name}-voxis.{output_ext}"
-        output_path = os.path.join(config.OUTPUT_FOLDER, output_filename)
-        
+
         if export_format == 'flac':
-            # Export as FLAC (lossless)
-            cmd = ['ffmpeg', '-y', '-i', job['output_file'], output_path]
-            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            # Export as FLAC (lossless) — encoded in-process by libsndfile
+            codec_args = None
+            variant = 'lossless'
             mimetype = 'audio/flac'
             
         elif export_format == 'mp3':
@@ -1087,21 +1998,43 @@ def export_file(job_id):
                 'high': '320k'
             }
             bitrate = bitrates.get(quality, '320k')
-            cmd = ['ffmpeg', '-y', '-i', job['output_file'], '-codec:a', 'libmp3lame', '-b:a', bitrate, output_path]
-            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            codec_args = ['-codec:a', 'libmp3lame', '-b:a', bitrate]
+            variant = bitrate
             mimetype = 'audio/mpeg'
+
+        cache_name = f"{export_cache_key(job_id, export_format, variant)}.{output_ext}"
+        output_path = os.path.join(TRANSCODE_FOLDER, cache_name)
+        # PERFORMANCE: Published artifacts are immutable — serve hits without the lock
+        if output_path in job.get('exports', ()) and os.path.exists(output_path):
+            logger.info(f"Export: {job_id[:8]} | {export_format.upper()} | {quality} | cached")
+            return send_audio_file(output_path, mimetype, output_filename)
+
+        with _transcode_lock(cache_name):
+            if os.path.exists(output_path):
+                logger.info(f"Export: {job_id[:8]} | {export_format.upper()} | {quality} | cached")
+            else:
+                # Transcode to a temp name, then publish atomically
+                partial_path = os.path.join(TRANSCODE_FOLDER, f"partial_{cache_name}")
+                try:
+                    if export_format == 'flac':
+                        _encode_flac(job['output_file'], partial_path)
+                    else:
+                        run_ffmpeg(['ffmpeg', '-y', '-loglevel', 'error', '-i', job['output_file'],
+                                    *codec_args, partial_path])
+                    os.replace(partial_path, output_path)
+                finally:
+                    if os.path.exists(partial_path):
+                        os.remove(partial_path)
+            with job_store.locked(job_id) as live_job:
+                if live_job is not None and output_path not in live_job.setdefault('exports', []):
+                    live_job['exports'].append(output_path)
+                encoder = 'libsndfile' if export_format == 'flac' else 'ffmpeg'
+                logger.info(f"Export: {job_id[:8]} | {export_format.upper()} | {quality} | {encoder}")
         
-        logger.info(f"Export: {job_id[:8]} | {export_format.upper()} | {quality} | ffmpeg")
-        
-        return send_file(
-            output_path,
-            mimetype=mimetype,
-            as_attachment=True,
-            download_name=output_filename
-        )
+        return send_audio_file(output_path, mimetype, output_filename)
         
     except subprocess.CalledProcessError as e:
-        logger.exception(f"Export ffmpeg error: {e.stderr.decode()}")
+        logger.exception(f"Export ffmpeg error: {e.stderr.decode(errors='replace')}")
         return jsonify({
             'error': 'Export failed (ffmpeg)',
             'message': str(e)
@@ -1120,19 +2053,17 @@ def list_jobs():
     status_filter = request.args.get('status')
     limit = min(100, int(request.args.get('limit', 50)))
     
-    with jobs_lock:
-        job_list = []
-        for j in sorted(jobs.values(), key=lambda x: x['created_at'], reverse=True)[:limit]:
-            if status_filter and j['status'] != status_filter:
-                continue
-            job_list.append({
-                'job_id': j['job_id'],
-                'status': j['status'],
-                'current_stage': j['current_stage'],
-                'progress': j['progress'],
-                'created_at': j['created_at'],
-                'completed_at': j['completed_at']
-            })
+    # PERFORMANCE: Newest-first walk of the creation index, O(limit)
+    job_list = []
+    for j in job_store.newest(limit, status_filter):
+        job_list.append({
+            'job_id': j['job_id'],
+            'status': j['status'],
+            'current_stage': j['current_stage'],
+            'progress': j['progress'],
+            'created_at': j['created_at'],
+            'completed_at': j['completed_at']
+        })
     
     return jsonify({
         'jobs': job_list,
@@ -1144,35 +2075,36 @@ def list_jobs():
 @app.route('/api/jobs/<job_id>', methods=['DELETE'])
 def delete_job(job_id):
     """Cancel or delete a job."""
-    try:
-        uuid.UUID(job_id)
-    except ValueError:
+    if not is_valid_id(job_id):
         return jsonify({'error': 'Invalid job_id format'}), 400
     
-    with jobs_lock:
-        job = jobs.get(job_id)
-        
-        if not job:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        # Remove files
-        files_removed = []
-        for file_key in ['input_file', 'output_file']:
-            filepath = job.get(file_key)
-            if filepath and os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                    files_removed.append(file_key)
-                except Exception:
-                    pass
-        
-        del jobs[job_id]
+    job = job_store.delete(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    notify_job_watchers()  # open event streams end with a 'deleted' event
+    
+    # A job still waiting in the pool queue never starts; a running one
+    # finishes in the background and its updates are dropped
+    future = active_processes.get(job_id)
+    cancelled = future is not None and future.cancel()
     
-    logger.info(f"Job deleted: {job_id[:8]} | Files removed: {files_removed}")
+    # Remove files (the record is already detached — no lock held)
+    files_removed = []
+    for file_key in ['input_file', 'output_file']:
+        if remove_job_file(job.get(file_key)):
+            files_removed.append(file_key)
+    # Cached exports are disposable — let the reaper unlink them
+    schedule_file_removal(list(job.get('exports', ())), reason=f"delete {job_id[:8]}")
+    if 'input_file' in files_removed:
+        forget_upload(job.get('file_id'))
+    
+    logger.info(f"Job deleted: {job_id[:8]} | Cancelled: {cancelled} | Files removed: {files_removed}")
     
     return jsonify({
         'success': True,
         'job_id': job_id,
+        'cancelled': cancelled,
         'files_removed': files_removed
     })
 
@@ -1187,26 +2119,12 @@ def graceful_shutdown(signum, frame):
     logger.info("Received shutdown signal, cleaning up...")
     shutdown_event.set()
     
-    # Terminate any active worker processes
-    for job_id, proc in list(active_processes.items()):
-        try:
-            if proc.is_alive():
-                logger.info(f"Terminating worker process for job {job_id[:8]}")
-                proc.terminate()
-                proc.join(timeout=2)
-                if proc.is_alive():
-                    proc.kill()
-        except Exception as e:
-            logger.warning(f"Error terminating process: {e}")
-    
-    # Close the multiprocessing queue to prevent semaphore leaks
-    # NOTE: queue.Queue (threading) does NOT have close/join_thread methods
-    # We only use those if using multiprocessing.Queue
-    # try:
-    #     job_updates_queue.close()
-    #     job_updates_queue.join_thread()
-    # except Exception as e:
-    #     logger.warning(f"Error closing queue: {e}")
+    # Drop queued jobs; running worker threads cannot be interrupted and
+    # are joined at interpreter exit
+    for job_id, future in list(active_processes.items()):
+        if future.cancel():
+            logger.info(f"Cancelled queued job {job_id[:8]}")
+    job_executor.shutdown(wait=False, cancel_futures=True)
     
     # Give active jobs a moment to complete
     time.sleep(1)
@@ -1224,16 +2142,8 @@ signal.signal(signal.SIGTERM, graceful_shutdown)
 # Register atexit handler for cleanup on normal exit
 def cleanup_on_exit():
     """Cleanup resources on normal program exit."""
-    # try:
-    #     job_updates_queue.close()
-    # except Exception:
-    #     pass
-    for proc in active_processes.values():
-        try:
-            if proc.is_alive():
-                proc.terminate()
-        except Exception:
-            pass
+    job_executor.shutdown(wait=False, cancel_futures=True)
+    log_listener.stop()  # drains queued records
 
 atexit.register(cleanup_on_exit)
 
@@ -1263,15 +2173,25 @@ def main():
     # Start cleanup scheduler
     start_cleanup_scheduler()
     
-    # Run server (never use reloader when frozen — it crashes PyInstaller)
+    # PERFORMANCE: Outside debug, serve through waitress — a real accept loop
+    # and bounded HTTP thread pool, separate from the pipeline worker pool.
+    # The reloader stays off: it would fork a second process with its own
+    # in-memory job store (and crashes PyInstaller builds).
     is_frozen = getattr(sys, 'frozen', False)
-    app.run(
-        host=config.HOST,
-        port=config.PORT,
-        debug=config.DEBUG if not is_frozen else False,
-        threaded=True,
-        use_reloader=False if is_frozen else config.DEBUG
-    )
+    debug = config.DEBUG and not is_frozen
+    if not debug and WAITRESS_AVAILABLE:
+        logger.info(f"Serving with waitress ({config.HTTP_THREADS} HTTP threads)")
+        waitress_serve(app, host=config.HOST, port=config.PORT, threads=config.HTTP_THREADS)
+    else:
+        if not debug:
+            logger.warning("waitress not installed — falling back to the Werkzeug dev server")
+        app.run(
+            host=config.HOST,
+            port=config.PORT,
+            debug=debug,
+            threaded=True,
+            use_reloader=False
+        )
 
 if __name__ == '__main__':
     main()
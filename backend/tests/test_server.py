@@ -0,0 +1,71 @@
+"""
+HTTP-level regression tests for the VOXIS backend server.
+
+Run from the repo root: python -m pytest backend/tests
+"""
+import io
+import os
+import shutil
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+pytest.importorskip("soundfile")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is required for upload ingest", allow_module_level=True)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    data = tmp_path_factory.mktemp("voxis")
+    os.environ["VOXIS_UPLOAD_DIR"] = str(data / "uploads")
+    os.environ["VOXIS_OUTPUT_DIR"] = str(data / "outputs")
+    from backend import server as server_module
+    return server_module
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    # Jobs must not load the real pipeline — the worker just returns
+    monkeypatch.setattr(server, "worker_process_entrypoint", lambda *args: None)
+    server.app.config["TESTING"] = True
+    return server.app.test_client()
+
+
+def _tone_wav(seconds=0.5, rate=48000) -> bytes:
+    t = np.arange(int(seconds * rate), dtype=np.float64)
+    samples = (8000 * np.sin(2 * np.pi * 440 * t / rate)).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+def test_upload_then_delete_job(client, server):
+    r = client.post("/api/upload", data={"file": (io.BytesIO(_tone_wav()), "tone.wav")},
+                    content_type="multipart/form-data")
+    assert r.status_code == 200, r.get_json()
+    upload = r.get_json()
+    assert server.upload_index.get(upload["file_id"]) is not None
+    assert upload["samplerate"] == 48000 and upload["channels"] == 2
+
+    r = client.post("/api/process", json={"file_id": upload["file_id"]})
+    assert r.status_code == 200, r.get_json()
+    job_id = r.get_json()["job_id"]
+
+    r = client.delete(f"/api/jobs/{job_id}")
+    assert r.status_code == 200, r.get_json()
+    assert server.job_store.get(job_id) is None
+    assert server.upload_index.get(upload["file_id"]) is None
+    assert client.get(f"/api/status/{job_id}").status_code == 404
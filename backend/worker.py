@@ -5,7 +5,7 @@ import time
 import multiprocessing
 import queue  # For exception handling
 import threading
-from datetime import datetime
+from collections import OrderedDict
 
 # ─── PERSISTENT PIPELINE CACHE ────────────────────────────────────────────────
 # The pipeline takes 15-30s to load all models (DeepFilterNet, VoiceRestore,
@@ -14,37 +14,52 @@ from datetime import datetime
 # first job pays the startup cost. Subsequent jobs start processing immediately.
 # ──────────────────────────────────────────────────────────────────────────────
 
-_pipeline_cache = None
+# Small LRU of loaded pipelines keyed by _pipeline_key(). Holding more than
+# one lets users alternate between e.g. two upscale factors without a full
+# model reload each time; each entry costs a full set of model weights.
+PIPELINE_CACHE_SIZE = max(1, int(os.environ.get('VOXIS_PIPELINE_CACHE_SIZE', 2)))
+_pipeline_cache = OrderedDict()
 _pipeline_cache_lock = threading.Lock()
-_pipeline_config_hash = None
+_import_lock = threading.Lock()
 
+# Resolved once at import rather than per job
+_WORKER_DIR = os.path.dirname(os.path.abspath(__file__))
+_ROOT_DIR = os.path.dirname(_WORKER_DIR)
 
-def _config_hash(config: dict) -> str:
-    """Create a hashable key from pipeline config. Only re-create pipeline if config changes."""
-    # These are the only params that affect pipeline construction
-    keys = sorted(config.keys())
-    return "|".join(f"{k}={config[k]}" for k in keys)
+# Config that shapes the loaded pipeline. Everything else is a per-run knob
+# carried by the per-job view from VoxisPipeline.with_runtime_config(), so
+# concurrent jobs never write to the shared cached instance.
+_PIPELINE_KEYS = (
+    ("target_sample_rate", 48000),
+    ("target_channels", 2),
+    ("upscale_factor", 2),
+    ("voicerestore_steps", 32),
+    ("high_precision", True),
+)
+
+
+def _pipeline_key(config: dict) -> tuple:
+    """Key a pipeline by the config that affects construction only."""
+    return tuple(config.get(k, default) for k, default in _PIPELINE_KEYS)
 
 
 def _get_or_create_pipeline(job_config: dict, logger):
     """Return cached pipeline or create a new one. Thread-safe."""
-    global _pipeline_cache, _pipeline_config_hash
-
     with _pipeline_cache_lock:
-        new_hash = _config_hash(job_config)
+        new_key = _pipeline_key(job_config)
 
-        if _pipeline_cache is not None and _pipeline_config_hash == new_hash:
+        pipeline = _pipeline_cache.get(new_key)
+        if pipeline is not None:
             logger.info("PIPELINE CACHE HIT — reusing loaded models (0s load time)")
-            return _pipeline_cache
-
-        # Cache miss — need to create/recreate
-        if _pipeline_cache is not None:
-            logger.info("PIPELINE CACHE MISS — config changed, rebuilding")
-            # Help GC collect the old pipeline's models
-            del _pipeline_cache
-            _pipeline_cache = None
-            import gc
-            gc.collect()
+            _pipeline_cache.move_to_end(new_key)
+            return pipeline.with_runtime_config(job_config)
+
+        # Cache miss — make room before loading so peak memory stays at the cap
+        if len(_pipeline_cache) >= PIPELINE_CACHE_SIZE:
+            logger.info("PIPELINE CACHE MISS — config changed, evicting least recently used")
+            _evict_lru_pipeline()
+        elif _pipeline_cache:
+            logger.info("PIPELINE CACHE MISS — new config, loading alongside cached pipeline")
         else:
             logger.info("PIPELINE CACHE MISS — first load, initializing models")
 
@@ -53,9 +68,74 @@ def _get_or_create_pipeline(job_config: dict, logger):
         except ImportError:
             from pipeline import create_pipeline
         pipeline = create_pipeline(job_config)
-        _pipeline_cache = pipeline
-        _pipeline_config_hash = new_hash
-        return pipeline
+        _pipeline_cache[new_key] = pipeline
+        # The first job on a key gets a view too — the cached instance stays pristine
+        return pipeline.with_runtime_config(job_config)
+
+
+def _evict_lru_pipeline():
+    """Drop the least recently used pipeline and release its memory. Caller holds the lock."""
+    _pipeline_cache.popitem(last=False)
+    # Help GC collect the old pipeline's models
+    import gc
+    gc.collect()
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _import_pipeline_module(logger) -> bool:
+    """Import the pipeline module (and torch) once. Returns PIPELINE_AVAILABLE."""
+    # Ensure root dir is in path for absolute backend.* imports
+    if _ROOT_DIR not in sys.path:
+        sys.path.insert(0, _ROOT_DIR)
+
+    # torch is imported lazily here, not by the HTTP server at boot.
+    # Serialize the first import so concurrent jobs can't race a
+    # half-initialized torch module; later imports are dict lookups.
+    with _import_lock:
+        # Apply torchaudio patch — must be before torchaudio import
+        # Handle both dev mode (backend.utils.*) and PyInstaller frozen mode
+        try:
+            import backend.utils.patch_torchaudio as patch_torchaudio
+        except ImportError:
+            try:
+                import utils.patch_torchaudio as patch_torchaudio
+            except ImportError:
+                logger.warning("patch_torchaudio not found — DeepFilterNet may fail")
+
+        try:
+            from backend.pipeline import PIPELINE_AVAILABLE
+        except ImportError:
+            try:
+                from pipeline import PIPELINE_AVAILABLE
+            except ImportError as e:
+                logger.error(f"Pipeline import error: {e}")
+                PIPELINE_AVAILABLE = False
+
+    return PIPELINE_AVAILABLE
+
+
+def warm_pipeline(job_config: dict = None):
+    """
+    Load the default pipeline into the cache ahead of the first job.
+    Submitted to the job pool at startup (VOXIS_PRELOAD_PIPELINE), so it
+    occupies a worker slot and jobs simply queue behind it.
+    """
+    logger = logging.getLogger("worker-warmup")
+    t0 = time.time()
+    try:
+        if not _import_pipeline_module(logger):
+            logger.warning("Pipeline not available — skipping warm-up")
+            return
+        _get_or_create_pipeline(job_config or {}, logger)
+        logger.info(f"Pipeline warm-up complete in {time.time()-t0:.1f}s")
+    except Exception as e:
+        logger.exception(f"Pipeline warm-up failed: {e}")
+
+
+# Minimum seconds between forwarded progress ticks within one stage
+PROGRESS_MIN_INTERVAL = 0.1
 
 
 # Helper for logging configuration in worker
@@ -80,34 +160,9 @@ def worker_process_entrypoint(job_id: str, input_path: str, output_path: str, jo
 
         # We use queue_obj passed from server
         queue_obj.put(('status', job_id, 'processing'))
-        queue_obj.put(('started', job_id, datetime.utcnow().isoformat()))
-
-        # Ensure root dir is in path for absolute backend.* imports
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        root_dir = os.path.dirname(current_dir)
-        if root_dir not in sys.path:
-            sys.path.insert(0, root_dir)
-
-        # Apply torchaudio patch — must be before torchaudio import
-        # Handle both dev mode (backend.utils.*) and PyInstaller frozen mode
-        try:
-            import backend.utils.patch_torchaudio as patch_torchaudio
-        except ImportError:
-            try:
-                import utils.patch_torchaudio as patch_torchaudio
-            except ImportError:
-                logger.warning("patch_torchaudio not found — DeepFilterNet may fail")
+        queue_obj.put(('started', job_id, time.time()))  # epoch; server formats on read
 
-        try:
-            from backend.pipeline import PIPELINE_AVAILABLE
-        except ImportError:
-            try:
-                from pipeline import PIPELINE_AVAILABLE
-            except ImportError as e:
-                logger.error(f"Pipeline import error: {e}")
-                PIPELINE_AVAILABLE = False
-
-        if not PIPELINE_AVAILABLE:
+        if not _import_pipeline_module(logger):
             raise RuntimeError("Audio processing pipeline not available in worker")
 
         t1 = time.time()
@@ -118,8 +173,16 @@ def worker_process_entrypoint(job_id: str, input_path: str, output_path: str, jo
         t2 = time.time()
         logger.info(f"Pipeline ready in {t2-t1:.1f}s (cached={t2-t1 < 1.0})")
 
-        # Progress callback
+        # Progress callback — PERFORMANCE: coalesced to <= 10 Hz per stage.
+        # Clients poll at ~1 Hz; stage changes and 100% always go through.
+        last_stage, last_sent = None, 0.0
+
         def on_progress(stage: str, progress: int, details: dict = None):
+            nonlocal last_stage, last_sent
+            now = time.monotonic()
+            if stage == last_stage and progress < 100 and now - last_sent < PROGRESS_MIN_INTERVAL:
+                return
+            last_stage, last_sent = stage, now
             queue_obj.put(('progress', job_id, stage, progress))
 
         # Run processing
@@ -141,11 +204,6 @@ def worker_process_entrypoint(job_id: str, input_path: str, output_path: str, jo
         except Exception:
             pass  # Queue might be closed
     finally:
-        # PERFORMANCE: Only flush GPU cache, don't destroy the pipeline
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except Exception:
-            pass
+        # Keep the pipeline cached; process() decides whether to release
+        # CUDA cache blocks, so there is no per-job device sync here
         logger.info("Worker thread exiting (pipeline cached for next job)")
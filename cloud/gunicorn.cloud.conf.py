@@ -1,12 +1,22 @@
 # VOXIS Cloud Backend Performance
 # Optimized for GPU workloads
 
+import os
+
+# CPU threading for torch/MKL/OpenBLAS: cores split between concurrently
+# running pipelines. Must be set before torch/numpy are first imported;
+# explicit environment values win.
+_cpu_threads = str(max(1, (os.cpu_count() or 8) // max(1, int(os.environ.get('VOXIS_MAX_CONCURRENT', 1)))))
+for _var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_var, _cpu_threads)
+
 # Binding
 bind = "0.0.0.0:5001"
 
 # Workers - fewer for GPU (memory intensive)
 workers = 1
-threads = 4
+# Exported so the app sizes its SSE stream cap from the real thread count
+threads = int(os.environ.setdefault('VOXIS_HTTP_THREADS', '4'))
 worker_class = "gthread"
 
 # Timeouts - longer for GPU processing
@@ -15,8 +25,7 @@ graceful_timeout = 120
 keepalive = 5
 
 # Memory management
-max_requests = 100
-max_requests_jitter = 20
+# No max_requests recycling — it would drop job state and the warmed models
 worker_tmp_dir = "/dev/shm"
 
 # Logging
@@ -30,3 +39,15 @@ proc_name = "voxis-cloud"
 
 # Preload app for faster worker spawning
 preload_app = True
+
+
+def post_worker_init(worker):
+    """
+    Load the default pipeline before the worker takes its first request.
+    Runs post-fork: CUDA contexts don't survive fork(), so models can't be
+    built in the master; torch imports are still shared via preload_app.
+    """
+    import sys
+    # Same module object the app uses, so the warmed cache is the one jobs hit
+    server_module = sys.modules[worker.wsgi.import_name]
+    server_module.warm_pipeline()
@@ -4,12 +4,17 @@ import time
 import sys
 import os
 import json
+import uuid
 import wave
-import struct
+
+import numpy as np
 
 BASE_URL = "http://localhost:5001/api"
 TEST_FILE = "test_audio_verify.wav"
 OUTPUT_FILE = "verified_output.wav"
+CHUNK_SIZE = 1 << 20  # 1 MiB — fewer send/recv syscalls than requests' defaults
+POLL_MIN_DELAY = 0.2  # seconds
+POLL_MAX_DELAY = 5.0
 
 def create_test_audio(filename):
     print(f"Generating test audio: {filename}...")
@@ -22,15 +27,12 @@ def create_test_audio(filename):
         obj.setsampwidth(2)  # 2 bytes
         obj.setframerate(sample_rate)
         
-        # Generate 440Hz sine wave
-        import math
+        # Generate 440Hz sine wave (one vectorized pass, little-endian int16)
         amplitude = 32767 // 2
         frequency = 440
-        data = bytearray()
-        for i in range(n_frames):
-            value = int(amplitude * math.sin(2 * math.pi * frequency * i / sample_rate))
-            data.extend(struct.pack('<h', value))
-        obj.writeframes(data)
+        t = np.arange(n_frames, dtype=np.float64)
+        data = (amplitude * np.sin(2 * np.pi * frequency * t / sample_rate)).astype('<i2')
+        obj.writeframes(data.tobytes())
     print("Test audio created.")
 
 def check_health():
@@ -43,14 +45,43 @@ def check_health():
         print(f"❌ Backend Health Failed: {e}")
         return False
 
+class StreamingMultipart:
+    """
+    Single-file multipart/form-data body streamed from disk in 1 MiB chunks.
+    requests buffers the whole file for `files=`; an iterable with __len__
+    is sent as-is with a Content-Length, so peak memory stays at one chunk.
+    """
+
+    def __init__(self, filename, field='file', content_type='audio/wav'):
+        self.filename = filename
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._head = (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field}"; filename="{os.path.basename(filename)}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode()
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode()
+        self._size = len(self._head) + os.path.getsize(filename) + len(self._tail)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        yield self._head
+        with open(self.filename, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                yield chunk
+        yield self._tail
+
 def upload_file(filename):
     print("Uploading file...")
-    with open(filename, 'rb') as f:
-        r = requests.post(f"{BASE_URL}/upload", files={'file': f})
-        r.raise_for_status()
-        data = r.json()
-        print(f"✅ Upload Successful. File ID: {data['file_id']}")
-        return data['file_id']
+    body = StreamingMultipart(filename)
+    r = requests.post(f"{BASE_URL}/upload", data=body, headers={'Content-Type': body.content_type})
+    r.raise_for_status()
+    data = r.json()
+    print(f"✅ Upload Successful. File ID: {data['file_id']}")
+    return data['file_id']
 
 def process_file(file_id):
     print("Starting processing job...")
@@ -68,33 +99,64 @@ def process_file(file_id):
     return data['job_id']
 
 def poll_status(job_id):
-    print("Polling for completion...")
+    print("Waiting for completion...")
+    # Server-sent events: one request, pushed on every state change
+    r = requests.get(f"{BASE_URL}/events/{job_id}", stream=True, timeout=(5, 60))
+    if r.status_code != 200:
+        # Stream slots exhausted (503) or an older server — fall back to polling
+        r.close()
+        return _poll_status_loop(job_id)
+    with r:
+        for line in r.iter_lines(decode_unicode=True):
+            if line.startswith('event: deleted'):
+                print("\n❌ Job was deleted")
+                return False
+            if not line.startswith('data: '):
+                continue  # blank separators and keep-alive comments
+            data = json.loads(line[len('data: '):])
+            if _report_status(data):
+                return data['status'] == 'complete'
+    print("\n❌ Event stream closed before the job finished")
+    return False
+
+def _poll_status_loop(job_id):
+    # Exponential backoff (0.2 s -> 5 s): quick jobs are caught fast, long
+    # jobs cost a few polls a minute; any visible change resets the delay
+    delay, last = POLL_MIN_DELAY, None
     while True:
         r = requests.get(f"{BASE_URL}/status/{job_id}")
         r.raise_for_status()
         data = r.json()
-        status = data['status']
-        stage = data.get('current_stage', 'unknown')
-        progress = data.get('progress', 0)
-        
-        sys.stdout.write(f"\rStatus: {status} | Stage: {stage} | Progress: {progress}%   ")
-        sys.stdout.flush()
-        
-        if status == 'complete':
-            print("\n✅ Processing Complete!")
-            return True
-        elif status == 'error':
-            print(f"\n❌ Processing Failed: {data.get('error')}")
-            return False
-            
-        time.sleep(1)
+        if _report_status(data):
+            return data['status'] == 'complete'
+        state = (data.get('current_stage'), data.get('progress'))
+        delay = POLL_MIN_DELAY if state != last else min(POLL_MAX_DELAY, delay * 1.5)
+        last = state
+        time.sleep(delay)
+
+def _report_status(data):
+    """Print a status update; True once the job has finished (either way)."""
+    status = data['status']
+    stage = data.get('current_stage', 'unknown')
+    progress = data.get('progress', 0)
+    
+    sys.stdout.write(f"\rStatus: {status} | Stage: {stage} | Progress: {progress}%   ")
+    sys.stdout.flush()
+    
+    if status == 'complete':
+        print("\n✅ Processing Complete!")
+        return True
+    elif status == 'error':
+        print(f"\n❌ Processing Failed: {data.get('error')}")
+        return True
+    return False
 
 def download_output(job_id, output_filename):
     print(f"Downloading output to {output_filename}...")
     r = requests.get(f"{BASE_URL}/download/{job_id}", stream=True)
     r.raise_for_status()
     with open(output_filename, 'wb') as f:
-        for chunk in r.iter_content(chunk_size=8192):
+        for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
             f.write(chunk)
     print("✅ Download Successful.")
     